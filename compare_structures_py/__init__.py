@@ -8,11 +8,16 @@ compare_structures - 增强版结构对比库
 """
 
 try:
-    from .compare_structures import compare_structures
+    from .compare_structures import compare_structures, iter_differences
 except ImportError:
     # 如果相对导入失败，尝试绝对导入（用于直接运行）
-    from compare_structures import compare_structures
+    # 经 importlib 按名称导入，mypy / mypyc 不会把同一文件再当作顶层模块 compare_structures 分析
+    import importlib
+
+    _module = importlib.import_module("compare_structures")
+    compare_structures = _module.compare_structures
+    iter_differences = _module.iter_differences
 
 __version__ = "1.0.0"
-__all__ = ["compare_structures"]
+__all__ = ["compare_structures", "iter_differences"]
 
@@ -1,24 +1,384 @@
 import sys
+import os
+import codecs
 import json
 
-from typing import Union, Dict, List, Any, Set, Tuple
-from copy import deepcopy
+from typing import Union, Dict, List, Any, Tuple, FrozenSet, Iterable, Iterator, Optional, Callable, DefaultDict, Deque
+from collections import defaultdict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+from itertools import chain, compress, islice
+from operator import is_not, ne, or_
 import re
-from logzero import logger
+import logging
+
+try:
+    # 可选依赖：安装 orjson 后命令行入口的 JSON 输出更快（解析仍使用标准库，见 _json_loads）
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+
+# open_log 使用的日志器：按模块名命名，默认只挂 NullHandler，输出与级别由宿主程序的 logging 配置决定
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+# 宿主程序未配置日志时，open_log=True 为 logger 挂上的 stderr 输出，整个进程只挂一次
+_stderr_handler: Optional[logging.Handler] = None
+
+
+def _ensure_log_output() -> None:
+    """
+    open_log=True 时调用：根日志器没有任何 handler（宿主程序未配置日志）时，
+    为 logger 挂上 stderr 输出（沿用 logzero 的默认格式）并放开到 DEBUG 级别，保证日志可见；
+    宿主程序已配置日志时不做任何改动，记录照常向上传递，由宿主程序捕获或屏蔽
+    """
+    global _stderr_handler
+    if _stderr_handler is not None or logging.getLogger().handlers:
+        return
+    handler = logging.StreamHandler()
+    handler.setFormatter(
+        logging.Formatter("[%(levelname)1.1s %(asctime)s %(module)s:%(lineno)d] %(message)s", "%y%m%d %H:%M:%S")
+    )
+    logger.addHandler(handler)
+    if logger.level == logging.NOTSET:
+        logger.setLevel(logging.DEBUG)
+    _stderr_handler = handler
+
+
+# 内部路径表示：(父路径, 路径段) 组成的链，根路径为 None，字典键为 str 段，列表下标为 int 段
+# 如 (((None, "rows"), 0), "link") 对应 "rows[0].link"；进入子节点只需新建一个二元组，不复制父路径
+_Path = Optional[Tuple[Any, Union[str, int]]]
+# 待对比的子节点：(origin值, current值, 路径, 排除字段游标, 对比上下文)
+_Task = Tuple[Any, Any, _Path, "Optional[_ExcludeCursor]", "_CompareContext"]
+# 对比生成器逐个产出子节点；产出 None 表示刚记录了差异，遍历器先把差异交给调用方再继续
+_Step = Optional[_Task]
+
+# [*] 通配符匹配用到的正则，模块加载时编译一次
+_INDEX_RE = re.compile(r"\[\d+\]")
+_INDEX_SUFFIX_RE = re.compile(r"\[\d+\]$")
+# 字段名中的 ['0'] 写法，需要标准化为 [0]
+_QUOTED_INDEX_RE = re.compile(r"\[\'(\d+)\'\]")
+
+# 未指定 exclude_fields 时默认排除的字段
+_DEFAULT_EXCLUDE_FIELDS = frozenset({"go_article_service"})
+
+# 字典取值时表示"键不存在"的哨兵，与 None 等合法值区分
+_MISSING = object()
+
+
+class _ExcludeNode:
+    """
+    排除字段前缀树的节点，子节点按路径段模式分两类保存：
+    literal 为普通字段名（如 "link"），只能与路径段完全相等，按字典直接查找；
+    wildcard 为以 [*] 结尾的模式（如 "rows[*]"、"[*]"），需要逐个按模式匹配
+    """
+
+    __slots__ = ("literal", "wildcard")
+
+    def __init__(self) -> None:
+        self.literal: Dict[str, "_ExcludeNode"] = {}
+        self.wildcard: Dict[str, "_ExcludeNode"] = {}
+
+    def child(self, pattern: str) -> "_ExcludeNode":
+        """取得（必要时创建）路径段模式 pattern 对应的子节点"""
+        table = self.wildcard if pattern.endswith("[*]") else self.literal
+        node = table.get(pattern)
+        if node is None:
+            node = table[pattern] = _ExcludeNode()
+        return node
+
+
+@lru_cache(maxsize=128)
+def _compile_exclude(exclude_fields: FrozenSet[str]) -> _ExcludeNode:
+    """
+    将排除字段集合预编译为按路径段组织的前缀树
+
+    参数:
+    exclude_fields (frozenset): 排除字段集合，如 {"user.medal", "list[*].interest_tag[*].add_time"}
+
+    返回:
+    _ExcludeNode: 前缀树的根节点，路径段模式保留原始写法（如 "rows[*]"、"[*]"、"link"）
+    """
+    trie = _ExcludeNode()
+    for field in exclude_fields:
+        node = trie
+        for part in field.split("."):
+            node = node.child(part)
+    return trie
+
+
+def _match_exclude_part(pattern: str, part: str) -> bool:
+    """判断单个路径段是否匹配排除字段中的对应段模式"""
+    # 完全等于 [*]：匹配任何包含 [数字] 的部分（可以是 [3] 或 rows[3] 等）
+    if pattern == "[*]":
+        return _INDEX_RE.search(part) is not None
+    # 以 [*] 结尾（如 "list[*]"）：必须是 base + [数字]，例如 category[*] 匹配 category[0]，但不匹配 category
+    if pattern.endswith("[*]"):
+        match = _INDEX_SUFFIX_RE.search(part)
+        return match is not None and part[: match.start()] == pattern[:-3]
+    return pattern == part
+
+
+def _format_path(raw_path: str) -> str:
+    """标准化路径格式：将 ['0'] 转换为 [0]，绝大多数字段名不含 [' 时直接返回"""
+    return _QUOTED_INDEX_RE.sub(r"[\1]", raw_path) if "['" in raw_path else raw_path
+
+
+def _path_segments(path: _Path) -> List[Union[str, int]]:
+    """按从根到叶的顺序取出路径链上的各段"""
+    segments: List[Union[str, int]] = []
+    while path is not None:
+        path, seg = path
+        segments.append(seg)
+    segments.reverse()
+    return segments
+
+
+def _render_path(path: _Path) -> str:
+    """将路径链拼接为差异信息中使用的路径字符串，如 rows → 0 → link 拼接为 rows[0].link，仅在输出差异时调用"""
+    # 直接拼接，字段名中的点号原样保留
+    rendered = ""
+    for seg in _path_segments(path):
+        if isinstance(seg, int):
+            rendered += f"[{seg}]"
+        elif rendered:
+            rendered += "." + seg
+        else:
+            # 根路径为空时字段名前不加点号
+            rendered = seg
+    return rendered
+
+
+def _is_top_level(path: _Path) -> bool:
+    """拼接后的路径为空字符串即视为顶层"""
+    # 从叶子一侧开始检查，绝大多数节点第一段就不为空，无需走完整条链
+    while path is not None:
+        path, seg = path
+        if seg != "":
+            return False
+    return True
+
+
+def _match_nodes(nodes: List[_ExcludeNode], part: str) -> List[_ExcludeNode]:
+    """在前缀树的一组节点中查找匹配路径段 part 的所有子节点"""
+    # 同一段可能同时匹配字面量和通配符模式，因此逐层维护所有命中的节点
+    matched: List[_ExcludeNode] = []
+    # 通配符模式只能匹配带 [数字] 的路径段，不含 [ 的段（绝大多数字段名）只需查字面量
+    has_index = "[" in part
+    for node in nodes:
+        child = node.literal.get(part)
+        if child is not None:
+            matched.append(child)
+        if has_index:
+            for pattern, child in node.wildcard.items():
+                if _match_exclude_part(pattern, part):
+                    matched.append(child)
+    return matched
+
+
+class _ExcludeCursor:
+    """
+    排除字段前缀树上的游标，随对比逐层下推，每个节点只需匹配新增的一段路径，不再从根重新匹配整条路径
+
+    路径拼接后按点号切分为若干段，列表下标拼在最后一段上（如 rows[0]），
+    因此游标分两部分保存：已确定的前面各段匹配到的节点 prefix，以及仍可能追加下标的最后一段 tail
+    路径被排除当且仅当每一段都能依次匹配到某个排除字段的前缀，即 tail 也有匹配节点
+    """
+
+    __slots__ = ("prefix", "tail", "tail_nodes", "excluded", "at_root")
+
+    def __init__(self, prefix: List[_ExcludeNode], tail: str, at_root: bool):
+        self.prefix = prefix
+        self.tail = tail
+        self.tail_nodes = _match_nodes(prefix, tail)
+        self.excluded = bool(self.tail_nodes)
+        # 根路径为空时下一个字段名直接作为首段，前面不加点号
+        self.at_root = at_root
+
+    def child_index(self, index: int) -> "_ExcludeCursor":
+        """进入列表下标后的游标：下标拼在最后一段上，前面各段的匹配结果不变"""
+        return _ExcludeCursor(self.prefix, f"{self.tail}[{index}]", False)
+
+    def child_key(self, key: str) -> "Optional[_ExcludeCursor]":
+        """
+        进入字典键后的游标，返回 None 表示该键及其所有后代都不可能被排除，后代节点无需再做排除检查
+        """
+        nodes = self.prefix if self.at_root else self.tail_nodes
+        # 字段名自身含点号时同样按点号切分为多段
+        *heads, tail = key.split(".")
+        for head in heads:
+            if not nodes:
+                return None
+            nodes = _match_nodes(nodes, head)
+        if not nodes:
+            return None
+        return _ExcludeCursor(nodes, tail, self.at_root and key == "")
+
+
+class _SubclassTable(Dict[type, bool]):
+    """按具体类型缓存 issubclass 判断结果，JSON 数据只会出现少数几种类型，判断退化为一次字典查找"""
+
+    __slots__ = ("_bases",)
+
+    def __init__(self, bases: Union[type, Tuple[type, ...]]) -> None:
+        super().__init__()
+        self._bases = bases
+
+    def __missing__(self, value_type: type) -> bool:
+        result = self[value_type] = issubclass(value_type, self._bases)
+        return result
+
+
+# 代替 isinstance(x, dict/list) 的类型判断表，用法：_IS_DICT[type(x)]，子类（如 OrderedDict）同样识别
+_IS_DICT = _SubclassTable(dict)
+_IS_INT = _SubclassTable(int)
+_IS_LIST = _SubclassTable(list)
+_IS_CONTAINER = _SubclassTable((dict, list))
+
+
+class _TypeGroups:
+    """
+    ignore_type_in_groups 配置的判断缓存
+    两个值是否属于同一类型组只取决于二者的类型，入口处把类型组展开为 (Origin类型, Current类型) 对的集合，
+    对比中每次判断只是一次集合查找
+    """
+
+    __slots__ = ("has_groups", "_group_pairs", "_sequence_group_pairs", "_converters")
+
+    def __init__(self, groups: Any):
+        # 未配置类型组（默认情况）时各项判断直接退化为类型是否相同，不再查集合
+        self.has_groups = bool(groups)
+        self._group_pairs = frozenset(
+            (origin_type, current_type) for group in groups for origin_type in group for current_type in group
+        )
+        # 等价值判断只认 list/tuple 形式的类型组
+        self._sequence_group_pairs = frozenset(
+            (origin_type, current_type)
+            for group in groups
+            if isinstance(group, (list, tuple))
+            for origin_type in group
+            for current_type in group
+        )
+        self._converters: Dict[Tuple[type, type], Optional[Callable[[Any, Any], bool]]] = {}
+
+    def in_same_group(self, origin_type: type, current_type: type) -> bool:
+        """两个类型是否同属某个类型组"""
+        return (origin_type, current_type) in self._group_pairs
+
+    def in_same_sequence_group(self, origin_type: type, current_type: type) -> bool:
+        """两个类型是否同属某个 list/tuple 形式的类型组（等价值判断只认这种写法）"""
+        return (origin_type, current_type) in self._sequence_group_pairs
+
+    def converter(self, origin_type: type, current_type: type) -> Optional[Callable[[Any, Any], bool]]:
+        """类型转换判断使用的比较函数，类型相同或不在同一类型组时返回 None"""
+        key = (origin_type, current_type)
+        try:
+            return self._converters[key]
+        except KeyError:
+            pass
+        if origin_type == current_type or not self.in_same_group(origin_type, current_type):
+            result = None
+        else:
+            result = _select_converter(origin_type, current_type)
+        self._converters[key] = result
+        return result
+
+
+class _CompareContext:
+    """单次对比过程中不变的配置，在递归中整体传递，替代逐层透传的参数列表"""
+
+    __slots__ = (
+        "check_value",
+        "check_missing",
+        "check_redundant",
+        "check_type",
+        "ignore_order",
+        "type_groups",
+        "open_log",
+        "check_top_level_list_length",
+        "enable_parallel",
+        "executor",
+        "_list_item_ctx",
+        "_sequential_ctx",
+    )
+
+    def __init__(
+        self,
+        check_value: bool,
+        check_missing: bool,
+        check_redundant: bool,
+        check_type: bool,
+        ignore_order: bool,
+        type_groups: _TypeGroups,
+        open_log: bool,
+        check_top_level_list_length: bool,
+        enable_parallel: bool,
+    ):
+        self.check_value = check_value
+        self.check_missing = check_missing
+        self.check_redundant = check_redundant
+        self.check_type = check_type
+        self.ignore_order = ignore_order
+        self.type_groups = type_groups
+        self.open_log = open_log
+        self.check_top_level_list_length = check_top_level_list_length
+        self.enable_parallel = enable_parallel
+        # 开启并行时整次对比共用一个线程池，派生的配置直接共享
+        self.executor: Optional[_SharedExecutor] = _SharedExecutor() if enable_parallel else None
+        self._list_item_ctx: Optional[_CompareContext] = None
+        self._sequential_ctx: Optional[_CompareContext] = None
+
+    def _derive(
+        self, check_value: bool, check_missing: bool, check_redundant: bool, enable_parallel: bool
+    ) -> "_CompareContext":
+        """派生只替换部分开关的配置，其余已解析的配置（类型组、线程池等）直接共享，不再重新解析"""
+        derived = _CompareContext(
+            check_value,
+            check_missing,
+            check_redundant,
+            self.check_type,
+            self.ignore_order,
+            self.type_groups,
+            self.open_log,
+            self.check_top_level_list_length,
+            enable_parallel,
+        )
+        derived.executor = self.executor
+        return derived
+
+    def list_item_context(self) -> "_CompareContext":
+        """列表深度对比中匹配元素的递归配置：检查值与缺失字段，不检查冗余字段，其余配置不变"""
+        if self._list_item_ctx is None:
+            if self.check_value and self.check_missing and not self.check_redundant:
+                self._list_item_ctx = self
+            else:
+                self._list_item_ctx = self._derive(True, True, False, self.enable_parallel)
+        return self._list_item_ctx
+
+    def sequential_context(self) -> "_CompareContext":
+        """并行对比的子树在工作线程中使用的配置：关闭并行，避免子树内的列表再嵌套创建线程池，其余配置不变"""
+        if not self.enable_parallel:
+            return self
+        if self._sequential_ctx is None:
+            self._sequential_ctx = self._derive(self.check_value, self.check_missing, self.check_redundant, False)
+        return self._sequential_ctx
 
 
 def compare_structures(
-    origin_data: Union[Dict, List],
-    current_data: Union[Dict, List],
+    # 入参类型在函数内校验（非字典/列表抛出 ValueError），签名上不做限制
+    origin_data: Any,
+    current_data: Any,
     path: str = "",
     check_value: bool = True,
     check_missing: bool = True,
     check_redundant: bool = False,
     check_type: bool = True,
-    exclude_fields: Set[str] = None,
-    deep_diff_contrast_config: Dict = None,
+    exclude_fields: Optional[Iterable[str]] = None,
+    deep_diff_contrast_config: Optional[Dict[str, Any]] = None,
     open_log: bool = False,
     check_top_level_list_length: bool = False,
+    max_diffs: Optional[int] = None,
+    enable_parallel: bool = False,
 ) -> List[str]:
     """
     增强版结构对比函数（Python原生实现）
@@ -33,6 +393,9 @@ def compare_structures(
     :param deep_diff_contrast_config: 对比配置参数
     :param open_log: 开启日志，默认关闭
     :param check_top_level_list_length: 是否在 check_value=False 时检查根列表长度差异，默认 False
+    :param max_diffs: 最多返回的差异条数，达到后立即停止对比，默认 None 表示不限制；
+        忽略顺序的列表需先完成整个列表的元素配对，这一步不会中途停止
+    :param enable_parallel: 是否用线程池并行对比长列表中的各元素子树，默认关闭；差异顺序与串行一致
     :return: 差异列表
     作者:崔浩浩
     功能
@@ -51,799 +414,1173 @@ def compare_structures(
     1. 对列表使用Python原生代码进行深度对比
     2. 支持忽略列表顺序（ignore_order）
     3. 支持配置类型组参数（如数值精度、类型检查等）
+    注意：对比过程只读取 origin_data / current_data，不会修改入参，因此不再对入参做深拷贝
     """
+    differences = iter_differences(
+        origin_data,
+        current_data,
+        path=path,
+        check_value=check_value,
+        check_missing=check_missing,
+        check_redundant=check_redundant,
+        check_type=check_type,
+        exclude_fields=exclude_fields,
+        deep_diff_contrast_config=deep_diff_contrast_config,
+        open_log=open_log,
+        check_top_level_list_length=check_top_level_list_length,
+        enable_parallel=enable_parallel,
+    )
+    return list(islice(differences, max_diffs))
 
-    # 内置函数定义开始
-    def _compare_dicts(
-        origin_dict: Dict,
-        current_dict: Dict,
-        path: str,
-        check_value: bool,
-        check_missing: bool,
-        check_redundant: bool,
-        check_type: bool,
-        exclude_fields: Set[str],
-        deep_diff_contrast_config: Dict,
-        differences: List[str],
-        open_log: bool,
-        check_top_level_list_length: bool,
-    ) -> List[str]:
-        """处理字典类型对比"""
-        # 检查Origin字段
-        for key in origin_dict:
-            current_path = _format_path(f"{path}.{key}" if path else key)
-            # 使用统一的排除检查函数
-            if _should_exclude(current_path, exclude_fields):
-                continue
 
-            origin_val = origin_dict[key]
+def iter_differences(
+    origin_data: Any,
+    current_data: Any,
+    path: str = "",
+    check_value: bool = True,
+    check_missing: bool = True,
+    check_redundant: bool = False,
+    check_type: bool = True,
+    exclude_fields: Optional[Iterable[str]] = None,
+    deep_diff_contrast_config: Optional[Dict[str, Any]] = None,
+    open_log: bool = False,
+    check_top_level_list_length: bool = False,
+    enable_parallel: bool = False,
+) -> Iterator[str]:
+    """
+    逐条产出差异的生成器版本，参数与 compare_structures 相同，差异顺序也相同
+    对比随迭代推进，调用方提前停止（如只关心是否存在差异）时不会对比剩余部分：
+        has_diff = next(iter_differences(origin, current), None) is not None
+    忽略顺序的列表需先完成整个列表的元素配对，这一步不会因提前停止而省去
+    开启 enable_parallel 时，长列表中各元素的子树会整体提交给线程池，这部分同样不会省去
+    """
+    if open_log:
+        _ensure_log_output()
+    # 排除字段只编译一次前缀树，对比时游标随路径逐段下推，每个节点只匹配新增的一段
+    # 传入 frozenset 时 frozenset() 直接返回原对象，不会再复制
+    exclude_trie = _compile_exclude(frozenset(exclude_fields or _DEFAULT_EXCLUDE_FIELDS))
+    cursor: Optional[_ExcludeCursor] = _ExcludeCursor([exclude_trie], "", True)
+    if path and cursor is not None:
+        cursor = cursor.child_key(path)
+    deep_diff_contrast_config = deep_diff_contrast_config or {
+        # 忽略对比列表顺序
+        "ignore_order": True,
+        # 忽略类型不一致
+        # 'ignore_type_in_groups': [(int, str, float, bool)],
+    }
 
-            # 字段存在性检查
-            if key not in current_dict:
-                if check_missing:
-                    differences.append(
-                        f"[字段缺失] {current_path} (Origin类型: {_type_detail(origin_val)})"
-                    )
-                continue
+    ctx = _CompareContext(
+        check_value,
+        check_missing,
+        check_redundant,
+        check_type,
+        # 对比配置在入口解析一次，递归过程中不再逐层查字典
+        bool(deep_diff_contrast_config.get("ignore_order", True)),
+        # 类型组判断结果在整个对比过程中按类型对缓存
+        _TypeGroups(deep_diff_contrast_config.get("ignore_type_in_groups", [])),
+        open_log,
+        check_top_level_list_length,
+        enable_parallel,
+    )
+    differences = _iter_compare(origin_data, current_data, (None, path) if path else None, cursor, ctx)
+    if ctx.executor is None:
+        return differences
+    return _close_executor_after(differences, ctx.executor)
 
-            current_val = current_dict[key]
-
-            # 递归处理嵌套结构
-            if isinstance(origin_val, (dict, list)):
-                differences += compare_structures(
-                    origin_val,
-                    current_val,
-                    current_path,
-                    check_value,
-                    check_missing,
-                    check_redundant,
-                    check_type,
-                    exclude_fields,
-                    deep_diff_contrast_config,
-                    open_log,
-                    check_top_level_list_length,
-                )
-            else:
-                # 值对比开启
-                if check_value:
-                    # 第一步：快速等价判断（优先于类型检查，需要配置 ignore_type_in_groups）
-                    if _is_equivalent_value(origin_val, current_val, deep_diff_contrast_config):
-                        continue  # 跳过差异记录
-                    
-                    # 第二步：类型冲突检查
-                    # 注意：字段值的类型检查（包括 dict/list）应该受 check_type 控制
-                    # 只有顶层结构类型（origin_data vs current_data）才始终检查
-                    if check_type and not _is_same_type(
-                        origin_val, current_val, deep_diff_contrast_config
-                    ):
-                        differences.append(
-                            f"[类型冲突] {current_path} "
-                            f"Origin类型: {_type_detail(origin_val)} → "
-                            f"Current类型: {_type_detail(current_val)}"
-                        )
-                        continue
-                    
-                    # 第三步：值对比
-                    if origin_val != current_val:
-                        differences.append(
-                            f"[值变化] {current_path} "
-                            f"Origin值: {_format_value(origin_val)} → "
-                            f"Current值: {_format_value(current_val)}"
-                        )
-                # 值对比关闭
-                else:
-                    # 当关闭值对比时，只进行特殊值检查（空值、零值等警告）
-                    # 注意：字段值的类型检查（包括 dict/list）应该受 check_type 控制
-                    # 只有顶层结构类型（origin_data vs current_data）才始终检查
-                    if check_type and not _is_same_type(origin_val, current_val, deep_diff_contrast_config):
-                        differences.append(
-                            f"[类型冲突] {current_path} "
-                            f"Origin类型: {_type_detail(origin_val)} → "
-                            f"Current类型: {_type_detail(current_val)}"
-                        )
-                    # 特殊值检查（空值、零值等警告，但不检查常规值变化）
-                    differences = _special_value_check(
-                        origin_val, current_val, current_path, differences
-                    )
-        # 冗余字段检查
-        if check_redundant:
-            for key in current_dict:
-                if key not in origin_dict:
-                    current_path = _format_path(f"{path}.{key}" if path else key)
-                    # 使用统一的排除检查函数
-                    if not _should_exclude(current_path, exclude_fields):
-                        differences.append(
-                            f"[冗余字段] {current_path} (Current类型: {_type_detail(current_dict[key])})"
-                        )
 
-        return differences
+def _close_executor_after(differences: Iterator[str], executor: "_SharedExecutor") -> Iterator[str]:
+    """逐条转交差异，迭代结束或调用方提前停止（生成器被关闭）时关闭整次对比共用的线程池"""
+    try:
+        yield from differences
+    finally:
+        executor.shutdown()
 
-    def _compare_lists(
-        origin_list: List,
-        current_list: List,
-        path: str,
-        check_value: bool,
-        check_missing: bool,
-        check_redundant: bool,
-        check_type: bool,
-        exclude_fields: Set[str],
-        deep_diff_contrast_config: Dict,
+
+def _iter_compare(
+    origin_data: Any,
+    current_data: Any,
+    path: _Path,
+    cursor: Optional[_ExcludeCursor],
+    ctx: "_CompareContext",
+) -> Iterator[str]:
+    """
+    对比入口：用显式栈代替函数递归，避免深层嵌套触发 Python 递归深度限制
+    栈中每一帧是一个字典/列表的对比生成器，生成器每产出一个子任务就先处理完该子树再继续，
+    因此差异的输出顺序与递归实现完全一致
+    字典/列表的对比循环每记录一条差异就交给调用方，调用方停止迭代时剩余部分不再对比
+    """
+    differences: List[str] = []
+    walker = _compare_node(origin_data, current_data, path, cursor, ctx, differences)
+    yield from differences
+    if walker is None:
+        return
+    differences.clear()
+
+    # 栈顶帧单独保存在 top 中，推进时无需反复取 stack[-1]；子任务直接解包传参，不再经 *child 重新打包
+    stack = [walker]
+    push = stack.append
+    pop = stack.pop
+    top = walker
+    while True:
+        for task in top:
+            if task is None:
+                # 当前帧刚记录了差异，先交给调用方，调用方停止迭代时本帧剩余部分不再对比
+                break
+            child_origin, child_current, child_path, child_cursor, child_ctx = task
+            child_walker = _compare_node(
+                child_origin, child_current, child_path, child_cursor, child_ctx, differences
+            )
+            if child_walker is not None:
+                push(child_walker)
+                top = child_walker
+                break
+        else:
+            pop()
+            if not stack:
+                break
+            top = stack[-1]
+        if differences:
+            yield from differences
+            differences.clear()
+    yield from differences
+
+
+def _collect_differences(
+    origin_data: Any,
+    current_data: Any,
+    path: _Path,
+    cursor: Optional[_ExcludeCursor],
+    ctx: "_CompareContext",
+) -> List[str]:
+    """在工作线程中完整对比一棵子树，返回其全部差异"""
+    return list(_iter_compare(origin_data, current_data, path, cursor, ctx))
+
+
+class _SharedExecutor:
+    """整次对比共用的线程池：第一次提交时才创建，没有需要并行的长列表时不产生任何线程"""
+
+    __slots__ = ("_executor",)
+
+    def __init__(self) -> None:
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def submit(
+        self,
+        origin_data: Any,
+        current_data: Any,
+        path: _Path,
+        cursor: Optional[_ExcludeCursor],
+        ctx: "_CompareContext",
+    ) -> "Future[List[str]]":
+        """提交一棵子树，在工作线程中完整对比"""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor()
+        return self._executor.submit(_collect_differences, origin_data, current_data, path, cursor, ctx)
+
+    def shutdown(self) -> None:
+        """等待已提交的子树完成并关闭线程池"""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+
+class _ParallelSubtrees:
+    """
+    列表元素子树的并行对比：子树提交给线程池，记录提交时差异列表的位置，
+    全部完成后按位置把各子树的差异拼回，输出顺序与逐个递归对比完全一致
+    在自由线程（无 GIL）的 Python 上可真正并行；普通 CPython 受 GIL 限制，一般不会更快
+    """
+
+    __slots__ = ("_ctx", "_executor", "_pending")
+
+    def __init__(self, ctx: "_CompareContext", executor: _SharedExecutor):
+        self._ctx = ctx
+        # 线程池由整次对比共用，这里只提交子树，不负责关闭
+        self._executor = executor
+        self._pending: List[Tuple[int, "Future[List[str]]"]] = []
+
+    def submit(
+        self,
         differences: List[str],
-        open_log: bool,
-        check_top_level_list_length: bool,
-    ) -> List[str]:
-        """列表对比逻辑"""
-        # 值对比开启
-        if check_value:
-            differences = _compare_lists_native(
-                origin_list,
-                current_list,
-                path,
-                check_type,
-                exclude_fields,
-                deep_diff_contrast_config,
-                differences,
-                open_log,
+        origin_data: Any,
+        current_data: Any,
+        path: _Path,
+        cursor: Optional[_ExcludeCursor],
+    ) -> None:
+        """提交一棵子树，其差异将插入到当前差异列表的末尾位置"""
+        future = self._executor.submit(origin_data, current_data, path, cursor, self._ctx)
+        self._pending.append((len(differences), future))
+
+    def merge(self, differences: List[str]) -> None:
+        """等待全部子树完成，按提交位置把子树差异拼回差异列表"""
+        if not self._pending:
+            return
+        merged: List[str] = []
+        start = 0
+        for position, future in self._pending:
+            merged.extend(differences[start:position])
+            merged.extend(future.result())
+            start = position
+        merged.extend(differences[start:])
+        differences[:] = merged
+
+
+def _compare_node(
+    origin_data: Any,
+    current_data: Any,
+    path: _Path,
+    cursor: Optional[_ExcludeCursor],
+    ctx: "_CompareContext",
+    differences: List[str],
+) -> Optional[Iterator[_Step]]:
+    """
+    对比单个节点，path 为路径链，仅在输出差异时才拼接为字符串
+    字典/列表返回逐个产出子任务的生成器，其余情况直接记录差异并返回 None
+    """
+    # 处理null值特殊情况（必须在类型检查之前）
+    if origin_data is None and current_data is None:
+        return None
+    if origin_data is None:
+        if ctx.check_missing:
+            differences.append(f"[字段缺失] {_render_path(path)} (Origin类型: null)")
+        return None
+    if current_data is None:
+        if ctx.check_redundant:
+            differences.append(f"[冗余字段] {_render_path(path)} (Current类型: null)")
+        return None
+
+    # 判断是否是第一次进入函数
+    if _is_top_level(path):
+        # 检查origin_data和current_data是否为字典和列表类型
+        if not _IS_CONTAINER[type(origin_data)] or not _IS_CONTAINER[type(current_data)]:
+            raise ValueError("Origin和Current数据必须是字典或列表类型")
+
+    # 同一个容器对象与自身对比不会产生差异，整棵子树直接跳过
+    if origin_data is current_data:
+        return None
+
+    # 主对比逻辑
+    if _IS_DICT[type(origin_data)] and _IS_DICT[type(current_data)]:
+        return _compare_dicts(origin_data, current_data, path, cursor, ctx, differences)
+    elif _IS_LIST[type(origin_data)] and _IS_LIST[type(current_data)]:
+        return _compare_lists(origin_data, current_data, path, cursor, ctx, differences)
+    else:
+        # origin_data和current_data类型不一致
+        # 注意：只有顶层结构类型才始终检查，不受 check_type 参数影响
+        # 嵌套结构中的类型检查应该受 check_type 控制
+        # 但需要考虑 deep_diff_contrast_config 中的 ignore_type_in_groups 配置
+        is_top_level = _is_top_level(path)
+        should_check_structure_type = is_top_level or ctx.check_type
+
+        if should_check_structure_type and not _is_same_type(origin_data, current_data, ctx.type_groups):
+            differences.append(
+                f"[类型冲突] {_render_path(path)} "
+                f"Origin类型: {_type_detail(origin_data)} → "
+                f"Current类型: {_type_detail(current_data)}"
             )
-        # 值对比关闭
+    return None
+
+
+def _compare_dicts(
+    origin_dict: Dict[Any, Any],
+    current_dict: Dict[Any, Any],
+    path: _Path,
+    cursor: Optional[_ExcludeCursor],
+    ctx: "_CompareContext",
+    differences: List[str],
+) -> Iterator[_Step]:
+    """处理字典类型对比"""
+    check_value = ctx.check_value
+    check_missing = ctx.check_missing
+    check_redundant = ctx.check_redundant
+    check_type = ctx.check_type
+    type_groups = ctx.type_groups
+    has_type_groups = type_groups.has_groups
+    append = differences.append
+
+    current_get = current_dict.get
+
+    # 检查Origin字段
+    for key, origin_val in origin_dict.items():
+        seg = _format_path(key if type(key) is str else str(key))
+        current_path = (path, seg)
+        # 游标为 None 时当前子树不存在可能命中的排除字段
+        child_cursor = cursor.child_key(seg) if cursor is not None else None
+        if child_cursor is not None and child_cursor.excluded:
+            continue
+
+        # 字段存在性检查（一次查找同时得到是否存在与取值）
+        current_val = current_get(key, _MISSING)
+        if current_val is _MISSING:
+            if check_missing:
+                append(
+                    f"[字段缺失] {_render_path(current_path)} (Origin类型: {_type_detail(origin_val)})"
+                )
+                yield None
+            continue
+
+        # 递归处理嵌套结构（两侧引用同一个容器时无需展开）
+        if _IS_CONTAINER[type(origin_val)]:
+            if origin_val is not current_val:
+                yield origin_val, current_val, current_path, child_cursor, ctx
         else:
-            # 首先检查列表长度差异（仅当显式开启时）
-            # 注意：只有顶层列表（path == ""）才检查长度差异，嵌套列表不检查
-            is_top_level = (path == "")
-            if (
-                check_top_level_list_length
-                and is_top_level
-                and len(origin_list) != len(current_list)
-            ):
-                # 检查路径是否在排除字段中
-                if not _should_exclude(path, exclude_fields):
-                    differences.append(
-                        f"[列表长度差异] {path} "
-                        f"Origin长度: {len(origin_list)} → "
-                        f"Current长度: {len(current_list)}"
+            # 值对比开启
+            if check_value:
+                # 第一步：快速等价判断（优先于类型检查，需要配置 ignore_type_in_groups，默认配置直接跳过）
+                # 类型相同且值相等（最常见）时不会产生差异，无需进入类型组的等价判断；NaN 与自身不等，仍按原逻辑处理
+                if has_type_groups and (
+                    (type(origin_val) is type(current_val) and origin_val == current_val)
+                    or _is_equivalent_value(origin_val, current_val, type_groups)
+                ):
+                    continue  # 跳过差异记录
+                
+                # 第二步：类型冲突检查
+                # 注意：字段值的类型检查（包括 dict/list）应该受 check_type 控制
+                # 只有顶层结构类型（origin_data vs current_data）才始终检查
+                # 类型完全相同（最常见）时无需进入类型组判断
+                if check_type and type(origin_val) is not type(current_val) and not _is_same_type(
+                    origin_val, current_val, type_groups
+                ):
+                    append(
+                        f"[类型冲突] {_render_path(current_path)} "
+                        f"Origin类型: {_type_detail(origin_val)} → "
+                        f"Current类型: {_type_detail(current_val)}"
                     )
-            
-            # 不检查值时需要校验字段是否非空
-            for i in range(min(len(origin_list), len(current_list))):
-                elem_path = f"{path}[{i}]"
-                if isinstance(origin_list[i], (dict, list)):
-                    differences += compare_structures(
-                        origin_list[i],
-                        current_list[i],
-                        elem_path,
-                        check_value,
-                        check_missing,
-                        check_redundant,
-                        check_type,
-                        exclude_fields,
-                        deep_diff_contrast_config,
-                        open_log,
-                        check_top_level_list_length,
+                    yield None
+                    continue
+                
+                # 第三步：值对比
+                if origin_val != current_val:
+                    append(
+                        f"[值变化] {_render_path(current_path)} "
+                        f"Origin值: {_format_value(origin_val)} → "
+                        f"Current值: {_format_value(current_val)}"
                     )
-                else:
-                    # 当关闭值对比时检查逻辑
-                    differences = _special_value_check(
-                        origin_list[i], current_list[i], elem_path, differences
+                    yield None
+            # 值对比关闭
+            else:
+                # 当关闭值对比时，只进行特殊值检查（空值、零值等警告）
+                # 注意：字段值的类型检查（包括 dict/list）应该受 check_type 控制
+                # 只有顶层结构类型（origin_data vs current_data）才始终检查
+                if check_type and type(origin_val) is not type(current_val) and not _is_same_type(
+                    origin_val, current_val, type_groups
+                ):
+                    append(
+                        f"[类型冲突] {_render_path(current_path)} "
+                        f"Origin类型: {_type_detail(origin_val)} → "
+                        f"Current类型: {_type_detail(current_val)}"
+                    )
+                    yield None
+                # 特殊值检查（空值、零值等警告，但不检查常规值变化）
+                _special_value_check(
+                    origin_val, current_val, current_path, differences
+                )
+                if differences:
+                    yield None
+    # 冗余字段检查
+    if check_redundant:
+        # 键视图的集合差在 C 层完成，两侧键集合一致（最常见）时无需逐键判断
+        redundant_keys = current_dict.keys() - origin_dict.keys()
+        if not redundant_keys:
+            return
+        # 按 Current 中的键顺序输出，保持差异顺序不变
+        for key, current_val in current_dict.items():
+            if key in redundant_keys:
+                seg = _format_path(key if type(key) is str else str(key))
+                child_cursor = cursor.child_key(seg) if cursor is not None else None
+                if child_cursor is None or not child_cursor.excluded:
+                    current_path = (path, seg)
+                    append(
+                        f"[冗余字段] {_render_path(current_path)} (Current类型: {_type_detail(current_val)})"
                     )
+                    yield None
 
-                    # 基础类型对比
-                    # 注意：列表元素的类型检查（包括 dict/list）应该受 check_type 控制
-                    # 只有顶层结构类型（origin_data vs current_data）才始终检查
-                    if check_type and not _is_same_type(
-                        origin_list[i], current_list[i], deep_diff_contrast_config
-                    ):
-                        differences.append(
-                            f"[类型冲突] {elem_path} "
-                            f"Origin类型: {_type_detail(origin_list[i])} → "
-                            f"Current类型: {_type_detail(current_list[i])}"
-                        )
-        return differences
 
-    def _compare_lists_native(
-        origin_list: List,
-        current_list: List,
-        path: str,
-        check_type: bool,
-        exclude_fields: Set[str],
-        deep_diff_contrast_config: Dict,
-        differences: List[str],
-        open_log: bool,
-    ) -> List[str]:
-        """
-        使用Python原生代码实现列表对比
-        """
-        if open_log:
-            logger.info(
-                f"_compare_lists_native: path={path}, "
-                f"origin_len={len(origin_list)}, current_len={len(current_list)}"
-            )
+def _compare_lists(
+    origin_list: List[Any],
+    current_list: List[Any],
+    path: _Path,
+    cursor: Optional[_ExcludeCursor],
+    ctx: "_CompareContext",
+    differences: List[str],
+) -> Iterator[_Step]:
+    """列表对比逻辑"""
+    check_type = ctx.check_type
+    type_groups = ctx.type_groups
+    append = differences.append
+
+    # 值对比开启
+    if ctx.check_value:
+        yield from _compare_lists_native(
+            origin_list, current_list, path, cursor, ctx, differences
+        )
+    # 值对比关闭
+    else:
+        # 首先检查列表长度差异（仅当显式开启时）
+        # 注意：只有顶层列表才检查长度差异，嵌套列表不检查
+        is_top_level = _is_top_level(path)
+        if (
+            ctx.check_top_level_list_length
+            and is_top_level
+            and len(origin_list) != len(current_list)
+        ):
+            # 检查路径是否在排除字段中
+            if cursor is None or not cursor.excluded:
+                append(
+                    f"[列表长度差异] {_render_path(path)} "
+                    f"Origin长度: {len(origin_list)} → "
+                    f"Current长度: {len(current_list)}"
+                )
+                yield None
         
-        ignore_order = deep_diff_contrast_config.get("ignore_order", True)
+        # 不检查值时需要校验字段是否非空
+        for i in range(min(len(origin_list), len(current_list))):
+            origin_item = origin_list[i]
+            current_item = current_list[i]
+            # 同一个对象（容器或基础值）在只检查特殊值时不会产生差异
+            if origin_item is current_item:
+                continue
+            elem_path = (path, i)
+            if _IS_CONTAINER[type(origin_item)]:
+                child_cursor = cursor.child_index(i) if cursor is not None else None
+                yield origin_item, current_item, elem_path, child_cursor, ctx
+            else:
+                # 当关闭值对比时检查逻辑
+                _special_value_check(
+                    origin_item, current_item, elem_path, differences
+                )
+                if differences:
+                    yield None
+
+                # 基础类型对比
+                # 注意：列表元素的类型检查（包括 dict/list）应该受 check_type 控制
+                # 只有顶层结构类型（origin_data vs current_data）才始终检查
+                if check_type and type(origin_item) is not type(current_item) and not _is_same_type(
+                    origin_item, current_item, type_groups
+                ):
+                    append(
+                        f"[类型冲突] {_render_path(elem_path)} "
+                        f"Origin类型: {_type_detail(origin_item)} → "
+                        f"Current类型: {_type_detail(current_item)}"
+                    )
+                    yield None
+
+
+def _compare_lists_native(
+    origin_list: List[Any],
+    current_list: List[Any],
+    path: _Path,
+    cursor: Optional[_ExcludeCursor],
+    ctx: "_CompareContext",
+    differences: List[str],
+) -> Iterator[_Step]:
+    """
+    使用Python原生代码实现列表对比
+    """
+    check_type = ctx.check_type
+    type_groups = ctx.type_groups
+    has_type_groups = type_groups.has_groups
+    append = differences.append
+    # 匹配元素的递归对比固定检查值与缺失字段、不检查冗余字段
+    item_ctx = ctx.list_item_context()
+    # 开启并行且列表足够长时，匹配元素的子树交给线程池对比，不再逐个产出子任务
+    parallel: Optional[_ParallelSubtrees] = None
+    executor = ctx.executor if ctx.enable_parallel else None
+    if executor is not None and min(len(origin_list), len(current_list)) >= _PARALLEL_MIN_ITEMS:
+        parallel = _ParallelSubtrees(item_ctx.sequential_context(), executor)
+    # 并行对比时子树差异按记录位置拼回，差异只能在全部完成后一起交给调用方
+    flush = parallel is None
+
+    # 日志级别被调高时不拼接路径；参数交给 logging 延迟格式化
+    if ctx.open_log and logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "_compare_lists_native: path=%s, origin_len=%d, current_len=%d",
+            _render_path(path),
+            len(origin_list),
+            len(current_list),
+        )
+    
+    # 如果忽略顺序，需要特殊处理
+    if ctx.ignore_order:
+        # 记录匹配关系：origin_index -> current_index
+        origin_matched = {}  # {origin_index: current_index}
+        current_matched = set()  # 已匹配的current索引
         
-        # 如果忽略顺序，需要特殊处理
-        if ignore_order:
-            # 创建副本以避免修改原始数据
-            origin_list_copy = deepcopy(origin_list)
-            current_list_copy = deepcopy(current_list)
-            
-            # 记录匹配关系：origin_index -> current_index
-            origin_matched = {}  # {origin_index: current_index}
-            current_matched = set()  # 已匹配的current索引
-            
-            # 第一遍：精确匹配并记录匹配关系
-            for i, origin_item in enumerate(origin_list_copy):
-                for j, current_item in enumerate(current_list_copy):
-                    if j in current_matched:
-                        continue
+        # 第一遍：精确匹配并记录匹配关系
+        current_buckets: Optional[DefaultDict[Any, Deque[int]]] = None
+        if not type_groups.has_groups:
+            # 未配置类型组时 _items_match 即严格的结构相等，可按匹配键分桶，线性时间完成配对
+            try:
+                origin_keys = [_match_key(item, check_type) for item in origin_list]
+                current_buckets = defaultdict(deque)
+                for j, current_item in enumerate(current_list):
+                    current_buckets[_match_key(current_item, check_type)].append(j)
+            except _UnhashableItem:
+                current_buckets = None
+
+        if current_buckets is not None:
+            # 每个桶内的下标保持升序，与逐个扫描时"取第一个未匹配元素"的结果一致
+            for i, key in enumerate(origin_keys):
+                bucket = current_buckets.get(key)
+                if bucket:
+                    j = bucket.popleft()
+                    origin_matched[i] = j
+                    current_matched.add(j)
+        else:
+            # 只在尚未匹配的 current 下标中按升序查找，已匹配的下标移出，不再被后续元素逐个跳过
+            unmatched = list(range(len(current_list)))
+            for i, origin_item in enumerate(origin_list):
+                for position, j in enumerate(unmatched):
                     # 检查是否匹配
-                    if _items_match(origin_item, current_item, check_type, deep_diff_contrast_config):
+                    if _items_match(origin_item, current_list[j], check_type, type_groups):
                         origin_matched[i] = j
                         current_matched.add(j)
+                        del unmatched[position]
                         break
+        
+        # 记录未匹配的元素
+        for i in range(len(origin_list)):
+            if i not in origin_matched:
+                # 检查是否在排除字段中
+                if cursor is not None and cursor.child_index(i).excluded:
+                    continue
+                elem_path = (path, i)
+                append(
+                    f"[列表差异] {_render_path(elem_path)} (iterable_item_removed)"
+                )
+                if flush:
+                    yield None
+        
+        for j in range(len(current_list)):
+            if j not in current_matched:
+                # 检查是否在排除字段中
+                if cursor is not None and cursor.child_index(j).excluded:
+                    continue
+                elem_path = (path, j)
+                append(
+                    f"[列表差异] {_render_path(elem_path)} (iterable_item_added)"
+                )
+                if flush:
+                    yield None
+        
+        # 按匹配键配对的元素逐层相等（检查类型时键中带有各层类型，且键中不含 NaN），递归对比不会产生任何差异，
+        # 无需再逐对展开；开启日志时仍然展开，保留嵌套列表的日志输出
+        if current_buckets is not None and not ctx.open_log:
+            return
+
+        # 对于已匹配的元素，递归对比（使用原始索引路径）
+        # 优化：即使元素在_items_match中匹配了，也要深入递归对比内部结构
+        for orig_idx, curr_idx in origin_matched.items():
+            origin_item = origin_list[orig_idx]
+            current_item = current_list[curr_idx]
+            # 匹配到同一个容器对象时无需排除检查和递归
+            if origin_item is current_item and _IS_CONTAINER[type(origin_item)]:
+                continue
+
+            child_cursor = cursor.child_index(orig_idx) if cursor is not None else None
+            if child_cursor is not None and child_cursor.excluded:
+                continue
+            elem_path = (path, orig_idx)
             
-            # 记录未匹配的元素
-            for i in range(len(origin_list_copy)):
-                if i not in origin_matched:
-                    elem_path = f"{path}[{i}]"
-                    # 检查是否在排除字段中
-                    if _should_exclude(elem_path, exclude_fields):
-                        continue
-                    differences.append(
-                        f"[列表差异] {elem_path} (iterable_item_removed)"
+            # 优化：对于复杂类型（dict/list），总是进行递归对比，即使_items_match返回True
+            # 这样可以检测到内部字段的细微差异
+            if _IS_CONTAINER[type(origin_item)] and _IS_CONTAINER[type(current_item)]:
+                if parallel is not None:
+                    parallel.submit(differences, origin_item, current_item, elem_path, child_cursor)
+                else:
+                    yield origin_item, current_item, elem_path, child_cursor, item_ctx
+            elif _IS_DICT[type(origin_item)] or _IS_DICT[type(current_item)]:
+                # 如果一个是dict另一个不是，说明类型不匹配
+                if check_type:
+                    append(
+                        f"[类型冲突] {_render_path(elem_path)} "
+                        f"Origin类型：{_type_detail(origin_item)} → "
+                        f"Current类型：{_type_detail(current_item)}"
                     )
-            
-            for j in range(len(current_list_copy)):
-                if j not in current_matched:
-                    elem_path = f"{path}[{j}]"
-                    # 检查是否在排除字段中
-                    if _should_exclude(elem_path, exclude_fields):
-                        continue
-                    differences.append(
-                        f"[列表差异] {elem_path} (iterable_item_added)"
+                    if flush:
+                        yield None
+            elif _IS_LIST[type(origin_item)] or _IS_LIST[type(current_item)]:
+                # 如果一个是list另一个不是，说明类型不匹配
+                if check_type:
+                    append(
+                        f"[类型冲突] {_render_path(elem_path)} "
+                        f"Origin类型：{_type_detail(origin_item)} → "
+                        f"Current类型：{_type_detail(current_item)}"
                     )
-            
-            # 对于已匹配的元素，递归对比（使用原始索引路径）
-            # 优化：即使元素在_items_match中匹配了，也要深入递归对比内部结构
-            for orig_idx, curr_idx in origin_matched.items():
-                elem_path = f"{path}[{orig_idx}]"
-                if _should_exclude(elem_path, exclude_fields):
-                    continue
-                
-                origin_item = origin_list_copy[orig_idx]
-                current_item = current_list_copy[curr_idx]
+                    if flush:
+                        yield None
+            else:
+                # 基础类型对比
+                # 第一步：检查等价值（优先于类型检查，需要配置 ignore_type_in_groups，默认配置直接跳过）
+                # 类型相同且值相等（最常见）时不会产生差异，无需进入类型组的等价判断；NaN 与自身不等，仍按原逻辑处理
+                if has_type_groups and (
+                    (type(origin_item) is type(current_item) and origin_item == current_item)
+                    or _is_equivalent_value(origin_item, current_item, type_groups)
+                ):
+                    continue  # 跳过差异记录
                 
-                # 优化：对于复杂类型（dict/list），总是进行递归对比，即使_items_match返回True
-                # 这样可以检测到内部字段的细微差异
-                if isinstance(origin_item, (dict, list)) and isinstance(current_item, (dict, list)):
-                    differences += compare_structures(
-                        origin_item,
-                        current_item,
-                        elem_path,
-                        True,  # check_value
-                        True,  # check_missing
-                        False,  # check_redundant
-                        check_type,
-                        exclude_fields,
-                        deep_diff_contrast_config,
-                        open_log,
-                        check_top_level_list_length,
+                # 第二步：类型冲突检查
+                if check_type and type(origin_item) is not type(current_item) and not _is_same_type(
+                    origin_item, current_item, type_groups
+                ):
+                    append(
+                        f"[类型冲突] {_render_path(elem_path)} "
+                        f"Origin类型：{_type_detail(origin_item)} → "
+                        f"Current类型：{_type_detail(current_item)}"
+                    )
+                    if flush:
+                        yield None
+                elif origin_item != current_item:
+                    # 检查类型转换
+                    if has_type_groups:
+                        skip = _type_conversion_judgment(origin_item, current_item, type_groups)
+                        if skip:
+                            continue
+                    # 两侧都是基础类型（容器已在前面分支处理），直接格式化叶子值
+                    append(
+                        f"[值变化] {_render_path(elem_path)} "
+                        f"Origin值: {_format_value(origin_item)} → Current值: {_format_value(current_item)}"
                     )
-                elif isinstance(origin_item, dict) or isinstance(current_item, dict):
-                    # 如果一个是dict另一个不是，说明类型不匹配
-                    if check_type:
-                        differences.append(
-                            f"[类型冲突] {elem_path} "
-                            f"Origin类型：{_type_detail(origin_item)} → "
-                            f"Current类型：{_type_detail(current_item)}"
-                        )
-                elif isinstance(origin_item, list) or isinstance(current_item, list):
-                    # 如果一个是list另一个不是，说明类型不匹配
-                    if check_type:
-                        differences.append(
-                            f"[类型冲突] {elem_path} "
-                            f"Origin类型：{_type_detail(origin_item)} → "
-                            f"Current类型：{_type_detail(current_item)}"
-                        )
+                    if flush:
+                        yield None
+    else:
+        # 不忽略顺序，按索引对比
+        max_len = max(len(origin_list), len(current_list))
+        min_len = min(len(origin_list), len(current_list))
+        indices: Iterable[int] = range(max_len)
+        # 两侧都是基础类型列表时，同一下标值相等（!= 为 False，NaN 仍视为不等）且类型相同的元素不会产生任何差异，
+        # 在 C 层一次筛出需要逐个检查的下标，长列表中只有少数元素变化时无需逐个下标执行对比逻辑
+        # 短列表逐个检查本身就很快，不值得额外的筛选开销
+        if min_len >= _SCALAR_SCAN_MIN_LEN:
+            origin_types = list(map(type, origin_list))
+            current_types = list(map(type, current_list))
+            if _HASHABLE_SCALAR_TYPES.issuperset(origin_types) and _HASHABLE_SCALAR_TYPES.issuperset(current_types):
+                if origin_types == current_types:
+                    changed: Iterator[bool] = map(ne, origin_list, current_list)
                 else:
-                    # 基础类型对比
-                    # 第一步：检查等价值（优先于类型检查，需要配置 ignore_type_in_groups）
-                    if _is_equivalent_value(origin_item, current_item, deep_diff_contrast_config):
-                        continue  # 跳过差异记录
-                    
-                    # 第二步：类型冲突检查
-                    if check_type and not _is_same_type(origin_item, current_item, deep_diff_contrast_config):
-                        differences.append(
-                            f"[类型冲突] {elem_path} "
-                            f"Origin类型：{_type_detail(origin_item)} → "
-                            f"Current类型：{_type_detail(current_item)}"
-                        )
-                    elif origin_item != current_item:
-                        # 检查类型转换
-                        if deep_diff_contrast_config.get("ignore_type_in_groups"):
-                            skip = _type_conversion_judgment(origin_item, current_item, deep_diff_contrast_config)
-                            if skip:
-                                continue
-                        old_formatted = _format_structure(origin_item)
-                        new_formatted = _format_structure(current_item)
-                        differences.append(
-                            f"[值变化] {elem_path} Origin值: {old_formatted} → Current值: {new_formatted}"
-                        )
-        else:
-            # 不忽略顺序，按索引对比
-            max_len = max(len(origin_list), len(current_list))
-            for i in range(max_len):
-                elem_path = f"{path}[{i}]"
-                
-                # 检查是否在排除字段中
-                if _should_exclude(elem_path, exclude_fields):
-                    continue
-                
-                if i >= len(origin_list):
-                    differences.append(
-                        f"[列表差异] {elem_path} (iterable_item_added)"
+                    changed = map(or_, map(ne, origin_list, current_list), map(is_not, origin_types, current_types))
+                indices = chain(compress(range(min_len), changed), range(min_len, max_len))
+            elif origin_types[0] is dict:
+                # 同构记录列表（各元素是字段相同的扁平字典）：按首个元素的字段生成专用判断函数，
+                # 字段逐一相等且类型相同的记录对不会产生任何差异，同样提前筛掉，字段不一致的记录仍逐个对比
+                record_changed = _record_checker(origin_list[0])
+                if record_changed is not None:
+                    indices = chain(
+                        compress(range(min_len), map(record_changed, origin_list, current_list)),
+                        range(min_len, max_len),
                     )
-                    continue
+        for i in indices:
+            # 同一下标引用同一个容器对象时无需排除检查和递归
+            if i < min_len and origin_list[i] is current_list[i] and _IS_CONTAINER[type(origin_list[i])]:
+                continue
+            # 检查是否在排除字段中
+            child_cursor = cursor.child_index(i) if cursor is not None else None
+            if child_cursor is not None and child_cursor.excluded:
+                continue
+            elem_path = (path, i)
+            
+            if i >= len(origin_list):
+                append(
+                    f"[列表差异] {_render_path(elem_path)} (iterable_item_added)"
+                )
+                if flush:
+                    yield None
+                continue
+            
+            if i >= len(current_list):
+                append(
+                    f"[列表差异] {_render_path(elem_path)} (iterable_item_removed)"
+                )
+                if flush:
+                    yield None
+                continue
+            
+            origin_item = origin_list[i]
+            current_item = current_list[i]
+            
+            # 递归对比
+            if _IS_CONTAINER[type(origin_item)] and _IS_CONTAINER[type(current_item)]:
+                if parallel is not None:
+                    parallel.submit(differences, origin_item, current_item, elem_path, child_cursor)
+                else:
+                    yield origin_item, current_item, elem_path, child_cursor, item_ctx
+            else:
+                # 基础类型对比
+                # 第一步：检查等价值（优先于类型检查，需要配置 ignore_type_in_groups，默认配置直接跳过）
+                # 类型相同且值相等（最常见）时不会产生差异，无需进入类型组的等价判断；NaN 与自身不等，仍按原逻辑处理
+                if has_type_groups and (
+                    (type(origin_item) is type(current_item) and origin_item == current_item)
+                    or _is_equivalent_value(origin_item, current_item, type_groups)
+                ):
+                    continue  # 跳过差异记录
                 
-                if i >= len(current_list):
-                    differences.append(
-                        f"[列表差异] {elem_path} (iterable_item_removed)"
+                # 第二步：类型冲突检查
+                if check_type and type(origin_item) is not type(current_item) and not _is_same_type(
+                    origin_item, current_item, type_groups
+                ):
+                    append(
+                        f"[类型冲突] {_render_path(elem_path)} "
+                        f"Origin类型：{_type_detail(origin_item)} → "
+                        f"Current类型：{_type_detail(current_item)}"
                     )
-                    continue
-                
-                origin_item = origin_list[i]
-                current_item = current_list[i]
-                
-                # 递归对比
-                if isinstance(origin_item, (dict, list)) and isinstance(current_item, (dict, list)):
-                    differences += compare_structures(
-                        origin_item,
-                        current_item,
-                        elem_path,
-                        True,  # check_value
-                        True,  # check_missing
-                        False,  # check_redundant
-                        check_type,
-                        exclude_fields,
-                        deep_diff_contrast_config,
-                        open_log,
-                        check_top_level_list_length,
+                    if flush:
+                        yield None
+                elif origin_item != current_item:
+                    # 检查类型转换
+                    if has_type_groups:
+                        skip = _type_conversion_judgment(origin_item, current_item, type_groups)
+                        if skip:
+                            continue
+                    old_formatted = _format_structure(origin_item)
+                    new_formatted = _format_structure(current_item)
+                    append(
+                        f"[值变化] {_render_path(elem_path)} Origin值: {old_formatted} → Current值: {new_formatted}"
                     )
-                else:
-                    # 基础类型对比
-                    # 第一步：检查等价值（优先于类型检查，需要配置 ignore_type_in_groups）
-                    if _is_equivalent_value(origin_item, current_item, deep_diff_contrast_config):
-                        continue  # 跳过差异记录
-                    
-                    # 第二步：类型冲突检查
-                    if check_type and not _is_same_type(origin_item, current_item, deep_diff_contrast_config):
-                        differences.append(
-                            f"[类型冲突] {elem_path} "
-                            f"Origin类型：{_type_detail(origin_item)} → "
-                            f"Current类型：{_type_detail(current_item)}"
-                        )
-                    elif origin_item != current_item:
-                        # 检查类型转换
-                        if deep_diff_contrast_config.get("ignore_type_in_groups"):
-                            skip = _type_conversion_judgment(origin_item, current_item, deep_diff_contrast_config)
-                            if skip:
-                                continue
-                        old_formatted = _format_structure(origin_item)
-                        new_formatted = _format_structure(current_item)
-                        differences.append(
-                            f"[值变化] {elem_path} Origin值: {old_formatted} → Current值: {new_formatted}"
-                        )
-        
-        return differences
-    
-    def _items_match(
-        origin_item: Any,
-        current_item: Any,
-        check_type: bool,
-        deep_diff_contrast_config: Dict,
-    ) -> bool:
-        """
-        判断两个列表元素是否匹配（用于忽略顺序的列表对比）
-        """
+                    if flush:
+                        yield None
+
+    # 并行提交的子树全部完成后按原位置拼回差异
+    if parallel is not None:
+        parallel.merge(differences)
+
+
+def _items_match(
+    origin_item: Any,
+    current_item: Any,
+    check_type: bool,
+    type_groups: "_TypeGroups",
+) -> bool:
+    """
+    判断两个列表元素是否匹配（用于忽略顺序的列表对比）
+    嵌套结构按显式栈逐对展开，嵌套层数超过递归深度限制的元素也能判断
+    """
+    has_groups = type_groups.has_groups
+    pending = [(origin_item, current_item)]
+    pop = pending.pop
+    push = pending.append
+    while pending:
+        origin_item, current_item = pop()
+        origin_type = type(origin_item)
+        current_type = type(current_item)
         # 类型检查
-        if check_type and not _is_same_type(origin_item, current_item, deep_diff_contrast_config):
+        if check_type and origin_type is not current_type and not _is_same_type(
+            origin_item, current_item, type_groups
+        ):
             return False
-        
+
         # 基本类型直接比较
-        if not isinstance(origin_item, (dict, list)) and not isinstance(current_item, (dict, list)):
+        if not _IS_CONTAINER[origin_type] and not _IS_CONTAINER[current_type]:
             # 检查类型转换
-            if deep_diff_contrast_config.get("ignore_type_in_groups"):
-                if _type_conversion_judgment(origin_item, current_item, deep_diff_contrast_config):
-                    return True
-            return origin_item == current_item
-        
-        # 复杂类型需要深度比较
-        if isinstance(origin_item, dict) and isinstance(current_item, dict):
+            if has_groups and _type_conversion_judgment(origin_item, current_item, type_groups):
+                continue
+            if not (origin_item == current_item):
+                return False
+            continue
+
+        # 同一个容器对象必然匹配
+        if origin_item is current_item:
+            continue
+
+        # 复杂类型需要深度比较，子元素对压栈后逐对判断
+        if _IS_DICT[origin_type] and _IS_DICT[current_type]:
             if len(origin_item) != len(current_item):
                 return False
             for key in origin_item:
                 if key not in current_item:
                     return False
-                if not _items_match(origin_item[key], current_item[key], check_type, deep_diff_contrast_config):
-                    return False
-            return True
-        
-        if isinstance(origin_item, list) and isinstance(current_item, list):
+                push((origin_item[key], current_item[key]))
+            continue
+
+        if _IS_LIST[origin_type] and _IS_LIST[current_type]:
             if len(origin_item) != len(current_item):
                 return False
-            # 对于列表，递归比较每个元素
-            for orig_elem, curr_elem in zip(origin_item, current_item):
-                if not _items_match(orig_elem, curr_elem, check_type, deep_diff_contrast_config):
-                    return False
-            return True
-        
+            pending.extend(zip(origin_item, current_item))
+            continue
+
         return False
+    return True
 
-    def _should_exclude(clean_path: str, exclude_fields: Set[str]) -> bool:
-        """
-        判断给定的路径是否需要被排除，支持多层结构和通配符 [*] 的匹配。
 
-        参数:
-        clean_path (str): 待检查的路径字符串，可能是多层级结构，如 "users.series.title"。
-        exclude_fields (set): 包含需要排除的字段的集合，部分字段可能带有通配符 [*]，
-                              例如 "list[*].interest_tag[*].add_time"。
+class _UnhashableItem(Exception):
+    """列表元素无法计算匹配键（如包含 NaN、非 JSON 基础类型或嵌套过深），需要回退为逐对比较"""
 
-        返回:
-        bool: 如果 clean_path 匹配到 exclude_fields 中的某个字段，则返回 True；否则返回 False。
-        """
-        # 将 clean_path 按点号分割成多个部分，用于后续逐部分匹配
-        clean_parts = clean_path.split(".")
-        # 遍历排除字段集合中的每个字段
-        for field in exclude_fields:
-            # 将当前排除字段按点号分割成多个部分
-            field_parts = field.split(".")
-            # 若排除字段的部分数量少于 clean_path 的部分数量，无法匹配，跳过该字段
-            if len(field_parts) < len(clean_parts):
-                continue
-            # 初始化匹配标志为 True
-            match = True
-            # 逐部分比较 clean_path 和当前排除字段
-            for i, part in enumerate(field_parts):
-                # 若已遍历完 clean_path 的所有部分，跳出循环
-                if i >= len(clean_parts):
-                    break
-                # 检查当前部分是否完全等于 [*]，若是则匹配任何包含 [数字] 的部分
-                if part == "[*]":
-                    # 检查 clean_path 对应部分是否包含 [数字] 格式（可以是 [3] 或 rows[3] 等）
-                    if not re.search(r'\[\d+\]', clean_parts[i]):
-                        match = False
-                        break
-                # 检查当前部分是否以 [*] 结尾，若是则表示使用了通配符（如 "list[*]"）
-                elif part.endswith("[*]"):
-                    # 提取 [*] 之前的基础部分
-                    base = part[:-3]
-                    # 检查 clean_path 对应部分是否以 base 开头，并且后面是 [数字] 格式
-                    clean_part = clean_parts[i]
-                    if clean_part.startswith(base + "["):
-                        # 检查是否匹配 [数字] 格式
-                        if not re.match(r'^' + re.escape(base) + r'\[\d+\]$', clean_part):
-                            match = False
-                            break
-                    else:
-                        # clean_part 必须包含 base 和 [数字]，不能只是 base
-                        # 例如：category[*] 应该匹配 category[0]，但不匹配 category
-                        match = False
-                        break
-                # 若当前部分不以 [*] 结尾，直接检查是否与 clean_path 对应部分不匹配
-                elif part != clean_parts[i]:
-                    match = False
-                    break
-            # 若所有部分都匹配，返回 True
-            if match:
-                return True
-        # 若遍历完所有排除字段都未匹配，返回 False
+
+# 可以直接作为匹配键的基础类型，其 == 与 hash 语义一致
+_HASHABLE_SCALAR_TYPES = frozenset({str, int, float, bool, type(None)})
+# 按索引对比基础类型列表或同构记录列表时，长度达到该值才先筛出变化的下标
+_SCALAR_SCAN_MIN_LEN = 16
+# 开启 enable_parallel 时，列表两侧长度都达到该值才并行对比元素子树，短列表的线程调度开销得不偿失
+_PARALLEL_MIN_ITEMS = 64
+# 匹配键递归计算，元素嵌套超过该层数时回退为逐对比较，避免超出递归深度限制
+_MATCH_KEY_MAX_DEPTH = 100
+# 未检查类型时 dict/list 匹配键的标记，避免与基础类型的键混淆
+_DICT_KEY_TAG = object()
+_LIST_KEY_TAG = object()
+
+
+def _record_checker(sample: Dict[Any, Any]) -> Optional[Callable[[Any, Any], bool]]:
+    """
+    按样本记录的字段取得同构记录的判断函数，样本不是字段名全为字符串的扁平字典时返回 None
+    判断函数对两侧元素返回"是否需要逐个对比"，只有确定不会产生差异时才返回 False
+    """
+    if not sample or not _is_flat_scalars(sample.values()):
+        return None
+    keys = tuple(sample)
+    if not all(type(key) is str for key in keys):
+        return None
+    return _compile_record_checker(keys)
+
+
+@lru_cache(maxsize=128)
+def _compile_record_checker(keys: Tuple[str, ...]) -> Callable[[Any, Any], bool]:
+    """
+    为一组字段生成同构记录的判断函数，字段名以常量写入代码，省去逐字段的循环与路径、游标等通用处理
+    两侧都是恰好包含这些字段的 dict，且每个字段类型相同（基础类型）、值相等时返回 False，其余情况一律返回 True，
+    交给通用对比逻辑处理；NaN 与自身不等，同样交给通用逻辑
+    """
+    lines = [
+        "def record_changed(origin, current):",
+        f"    if type(origin) is not dict or type(current) is not dict or len(origin) != {len(keys)} "
+        f"or len(current) != {len(keys)}:",
+        "        return True",
+        "    try:",
+    ]
+    for key in keys:
+        lines.append(f"        a = origin[{key!r}]")
+        lines.append(f"        b = current[{key!r}]")
+        lines.append("        if type(a) is not type(b) or type(a) not in scalar_types or a != b:")
+        lines.append("            return True")
+    lines.append("    except KeyError:")
+    lines.append("        return True")
+    lines.append("    return False")
+    namespace: Dict[str, Any] = {"scalar_types": _HASHABLE_SCALAR_TYPES}
+    exec("\n".join(lines), namespace)
+    checker: Callable[[Any, Any], bool] = namespace["record_changed"]
+    return checker
+
+
+def _is_flat_scalars(values: Any) -> bool:
+    """容器内的值是否全部可以直接作为匹配键（基础类型且不含 NaN）"""
+    if not _HASHABLE_SCALAR_TYPES.issuperset(map(type, values)):
         return False
+    # NaN 与自身不相等；map(ne) 在 C 层完成逐个比较
+    return not any(map(ne, values, values))
 
-    def _type_conversion_judgment(old_value: Any, new_value: Any, deep_diff_contrast_config: Dict) -> bool:
-        """
-        类型转换判断逻辑
-        
-        Returns:
-            bool: 如果应该跳过类型检查返回 True，否则返回 False
-        """
-        type_groups = deep_diff_contrast_config.get("ignore_type_in_groups", [])
-        if not type_groups:
-            return False
-        
-        old_type = type(old_value)
-        new_type = type(new_value)
-        
-        # 如果类型相同，不需要转换判断
-        if old_type == new_type:
-            return False
-        
-        for group in type_groups:
-            if old_type in group and new_type in group:
-                try:
-                    # 尝试转换为相同类型后比较
-                    if old_type == str:
-                        return old_value == str(new_value)
-                    elif old_type == int:
-                        return old_value == int(new_value)
-                    elif old_type == float:
-                        return old_value == float(new_value)
-                    elif new_type == str:
-                        return str(old_value) == new_value
-                    elif new_type == int:
-                        return int(old_value) == new_value
-                    elif new_type == float:
-                        return float(old_value) == new_value
-                except (ValueError, TypeError):
-                    continue
-        
-        return False  # 默认返回 False
 
-    def _special_value_check(
-        origin_val: Any, current_val: Any, path: str, differences: List[str]
-    ) -> List[str]:
-        """
-        统一特殊值检查函数
-        注意：此函数在 check_value=False 时被调用，只检查特殊值（空值、零值等），不检查常规值变化
-        """
-        # 类型分流检查（注意：布尔值需要先检查，因为 isinstance(True, int) 返回 True）
-        if isinstance(origin_val, bool) and isinstance(current_val, bool):
-            # 布尔值变化检查（特殊值检查，因为布尔值变化通常很重要）
-            if origin_val != current_val:
+def _match_key(item: Any, check_type: bool, depth: int = 0) -> Any:
+    """
+    计算列表元素的匹配键（未配置 ignore_type_in_groups 时使用）
+    两个元素的匹配键相等，当且仅当 _items_match 判定二者匹配
+
+    Raises:
+        _UnhashableItem: 元素中包含无法可靠计算匹配键的值，或嵌套层数超过 _MATCH_KEY_MAX_DEPTH
+    """
+    item_type = type(item)
+    if _IS_DICT[item_type]:
+        tag = item_type if check_type else _DICT_KEY_TAG
+        values = item.values()
+        if _is_flat_scalars(values):
+            # 值全是基础类型（API 返回的扁平对象数组最常见），整体交给 C 层构造，结果与逐个计算一致
+            if check_type:
+                return tag, frozenset(zip(item, zip(map(type, values), values)))
+            return tag, frozenset(item.items())
+        if depth >= _MATCH_KEY_MAX_DEPTH:
+            raise _UnhashableItem
+        return tag, frozenset((key, _match_key(value, check_type, depth + 1)) for key, value in item.items())
+    if _IS_LIST[item_type]:
+        tag = item_type if check_type else _LIST_KEY_TAG
+        if _is_flat_scalars(item):
+            if check_type:
+                return tag, tuple(zip(map(type, item), item))
+            return tag, tuple(item)
+        if depth >= _MATCH_KEY_MAX_DEPTH:
+            raise _UnhashableItem
+        return tag, tuple(_match_key(elem, check_type, depth + 1) for elem in item)
+    # NaN 与自身不相等，不能作为字典键参与分桶
+    if item_type not in _HASHABLE_SCALAR_TYPES or item != item:
+        raise _UnhashableItem
+    # 检查类型时 1、1.0、True 互不匹配，需要把类型放进键里
+    return (item_type, item) if check_type else item
+
+
+def _type_conversion_judgment(old_value: Any, new_value: Any, type_groups: _TypeGroups) -> bool:
+    """
+    类型转换判断逻辑
+    
+    Returns:
+        bool: 如果应该跳过类型检查返回 True，否则返回 False
+    """
+    if not type_groups.has_groups:
+        return False
+    
+    # 类型相同或不在同一类型组时没有比较函数，不需要转换判断
+    converter = type_groups.converter(type(old_value), type(new_value))
+    if converter is None:
+        return False
+    try:
+        # 尝试转换为相同类型后比较
+        return converter(old_value, new_value)
+    except (ValueError, TypeError):
+        return False
+
+
+def _select_converter(old_type: type, new_type: type) -> Optional[Callable[[Any, Any], bool]]:
+    """按类型选择转换后比较的函数，优先把 Current 值转换为 Origin 的类型"""
+    if old_type == str:
+        return lambda old_value, new_value: old_value == str(new_value)
+    elif old_type == int:
+        return lambda old_value, new_value: old_value == int(new_value)
+    elif old_type == float:
+        return lambda old_value, new_value: old_value == float(new_value)
+    elif new_type == str:
+        return lambda old_value, new_value: str(old_value) == new_value
+    elif new_type == int:
+        return lambda old_value, new_value: int(old_value) == new_value
+    elif new_type == float:
+        return lambda old_value, new_value: float(old_value) == new_value
+    return None
+
+
+def _special_value_check(
+    origin_val: Any, current_val: Any, path: _Path, differences: List[str]
+) -> None:
+    """
+    统一特殊值检查函数
+    注意：此函数在 check_value=False 时被调用，只检查特殊值（空值、零值等），不检查常规值变化
+    """
+    # 类型分流检查（注意：布尔值需要先检查，因为 isinstance(True, int) 返回 True）
+    if isinstance(origin_val, bool) and isinstance(current_val, bool):
+        # 布尔值变化检查（特殊值检查，因为布尔值变化通常很重要）
+        if origin_val != current_val:
+            differences.append(
+                f"[值变化] {_render_path(path)} "
+                f"Origin值: {origin_val} → "
+                f"Current值: {current_val}"
+            )
+    
+    elif isinstance(origin_val, str) and isinstance(current_val, str):
+        # 字符串空值检查（特殊值检查）
+        if origin_val.strip() != "" and current_val.strip() == "":
+            differences.append(
+                f"[值变化] {_render_path(path)} "
+                f"Origin值: '{_truncate(origin_val, 30)}' → "
+                f"Current值: '{_truncate(current_val, 30)}' (空值警告)"
+            )
+        # 注意：不检查常规字符串值变化，因为 check_value=False
+
+    elif isinstance(origin_val, (int, float)) and isinstance(current_val, (int, float)):
+        # 数值类型检查（只检查特殊值：负数、零值等）
+        # 用查表代替 isinstance，避免编译后把 bool 收窄为 int 输出成 1/0
+        if _IS_INT[type(origin_val)] and _IS_INT[type(current_val)]:
+            # 整数值合法性检查（特殊值检查：负数/零值）
+            if origin_val != current_val and current_val <= 0:
                 differences.append(
-                    f"[值变化] {path} "
+                    f"[值变化] {_render_path(path)} "
                     f"Origin值: {origin_val} → "
-                    f"Current值: {current_val}"
-                )
-        
-        elif isinstance(origin_val, str) and isinstance(current_val, str):
-            # 字符串空值检查（特殊值检查）
-            if origin_val.strip() != "" and current_val.strip() == "":
-                differences.append(
-                    f"[值变化] {path} "
-                    f"Origin值: '{_truncate(origin_val, 30)}' → "
-                    f"Current值: '{_truncate(current_val, 30)}' (空值警告)"
+                    f"Current值: {current_val} (负数/零警告)"
                 )
-            # 注意：不检查常规字符串值变化，因为 check_value=False
-
-        elif isinstance(origin_val, (int, float)) and isinstance(current_val, (int, float)):
-            # 数值类型检查（只检查特殊值：负数、零值等）
-            if isinstance(origin_val, int) and isinstance(current_val, int):
-                # 整数值合法性检查（特殊值检查：负数/零值）
-                if origin_val != current_val and current_val <= 0:
+            # 注意：不检查常规整数值变化，因为 check_value=False
+        else:
+            # 浮点数或混合数值类型变化检查（只检查零值）
+            if origin_val != current_val:
+                if (isinstance(current_val, float) and current_val == 0.0) or (isinstance(current_val, int) and current_val == 0):
                     differences.append(
-                        f"[值变化] {path} "
+                        f"[值变化] {_render_path(path)} "
                         f"Origin值: {origin_val} → "
-                        f"Current值: {current_val} (负数/零警告)"
+                        f"Current值: {current_val} (零值警告)"
                     )
-                # 注意：不检查常规整数值变化，因为 check_value=False
-            else:
-                # 浮点数或混合数值类型变化检查（只检查零值）
-                if origin_val != current_val:
-                    if (isinstance(current_val, float) and current_val == 0.0) or (isinstance(current_val, int) and current_val == 0):
-                        differences.append(
-                            f"[值变化] {path} "
-                            f"Origin值: {origin_val} → "
-                            f"Current值: {current_val} (零值警告)"
-                        )
-                    # 注意：不检查常规数值变化，因为 check_value=False
+                # 注意：不检查常规数值变化，因为 check_value=False
 
-        return differences
 
+def _is_equivalent_value(origin_val: Any, current_val: Any, type_groups: _TypeGroups) -> bool:
+    """
+    独立等价判断逻辑
+    只有当 deep_diff_contrast_config.ignore_type_in_groups 配置了相应类型组时才启用等价值判断
+    """
+    # 如果没有配置 ignore_type_in_groups，则不进行等价值判断
+    if not type_groups.has_groups:
+        return False
+    
+    # 如果类型不在同一个类型组中，不进行等价值判断
+    if not type_groups.in_same_sequence_group(type(origin_val), type(current_val)):
+        return False
+    
+    # 空字符串与0等价（需要配置了 number 和 string 类型组）
+    if (origin_val == "" and current_val == 0) or (
+        origin_val == 0 and current_val == ""
+    ):
+        return True
 
-    def _is_equivalent_value(origin_val: Any, current_val: Any, deep_diff_contrast_config: Dict) -> bool:
-        """
-        独立等价判断逻辑
-        只有当 deep_diff_contrast_config.ignore_type_in_groups 配置了相应类型组时才启用等价值判断
-        """
-        # 如果没有配置 ignore_type_in_groups，则不进行等价值判断
-        type_groups = deep_diff_contrast_config.get("ignore_type_in_groups", []) if deep_diff_contrast_config else []
-        if not type_groups or len(type_groups) == 0:
-            return False
-        
-        # 检查类型是否在配置的类型组中
-        origin_type = type(origin_val)
-        current_type = type(current_val)
-        
-        # 判断两个类型是否在同一个类型组中
-        types_in_same_group = False
-        for group in type_groups:
-            if not isinstance(group, (list, tuple)):
-                continue
-            
-            # 检查类型是否在组中
-            origin_in_group = origin_type in group
-            current_in_group = current_type in group
-            
-            if origin_in_group and current_in_group:
-                types_in_same_group = True
-                break
-        
-        # 如果类型不在同一个类型组中，不进行等价值判断
-        if not types_in_same_group:
-            return False
-        
-        # 空字符串与0等价（需要配置了 number 和 string 类型组）
-        if (origin_val == "" and current_val == 0) or (
-            origin_val == 0 and current_val == ""
-        ):
-            return True
+    # 数字字符串与数字等价
+    if (
+        isinstance(origin_val, str)
+        and origin_val.isdigit()
+        and isinstance(current_val, (int, float))
+    ):
+        return int(origin_val) == current_val
+    if (
+        isinstance(current_val, str)
+        and current_val.isdigit()
+        and isinstance(origin_val, (int, float))
+    ):
+        return int(current_val) == origin_val
+    
+    # 浮点数字符串与数字等价
+    if isinstance(origin_val, str) and isinstance(current_val, (int, float)):
+        try:
+            return float(origin_val) == float(current_val)
+        except (ValueError, TypeError):
+            pass
+    if isinstance(current_val, str) and isinstance(origin_val, (int, float)):
+        try:
+            return float(current_val) == float(origin_val)
+        except (ValueError, TypeError):
+            pass
 
-        # 数字字符串与数字等价
-        if (
-            isinstance(origin_val, str)
-            and origin_val.isdigit()
-            and isinstance(current_val, (int, float))
-        ):
-            return int(origin_val) == current_val
-        if (
-            isinstance(current_val, str)
-            and current_val.isdigit()
-            and isinstance(origin_val, (int, float))
-        ):
-            return int(current_val) == origin_val
-        
-        # 浮点数字符串与数字等价
-        if isinstance(origin_val, str) and isinstance(current_val, (int, float)):
-            try:
-                return float(origin_val) == float(current_val)
-            except (ValueError, TypeError):
-                pass
-        if isinstance(current_val, str) and isinstance(origin_val, (int, float)):
-            try:
-                return float(current_val) == float(origin_val)
-            except (ValueError, TypeError):
-                pass
+    # 浮点数与整数等价（值相等时）
+    if isinstance(origin_val, float) and isinstance(current_val, int):
+        return origin_val == float(current_val)
+    if isinstance(origin_val, int) and isinstance(current_val, float):
+        return float(origin_val) == current_val
 
-        # 浮点数与整数等价（值相等时）
-        if isinstance(origin_val, float) and isinstance(current_val, int):
-            return origin_val == float(current_val)
-        if isinstance(origin_val, int) and isinstance(current_val, float):
-            return float(origin_val) == current_val
+    return False
 
-        return False
 
-    def _is_same_type(origin_val: Any, current_val: Any, config: Dict) -> bool:
-        """仅处理类型组配置"""
-        type_groups = config.get("ignore_type_in_groups", [])
-        for group in type_groups:
-            if (type(origin_val) in group) and (type(current_val) in group):
-                return True
-        return type(origin_val) is type(current_val)
-
-    def _format_path(raw_path: str) -> str:
-        """标准化路径格式：将 ['0'] 转换为"""
-        return re.sub(r"\[\'(\d+)\'\]", r"[\1]", raw_path)
-
-    def _type_detail(obj: Any) -> str:
-        """增强类型描述"""
-        if obj is None:
-            return "null"
-        if isinstance(obj, bool):
-            return "bool"
-        if isinstance(obj, (int, float)):
-            return f"{type(obj).__name__}({obj})"
-        if isinstance(obj, str):
-            return f"str('{_truncate(obj)}')" if obj else "str(空)"
-        if isinstance(obj, list):
-            return f"list[{len(obj)}]"
-        if isinstance(obj, dict):
-            return f"dict[{len(obj)}]"
-        return type(obj).__name__
-
-    def _format_value(value: Any) -> str:
-        """仅格式化单个值，不修改容器结构"""
-        if isinstance(value, str):
-            if value == "":
-                return "'' → (等价0)"
-            if value.isdigit():
-                return f"'{value}' → ({int(value)})"
-            return f"'{value}'"
-
-        if isinstance(value, bool):
-            return str(value).lower()
-
-        if isinstance(value, (int, float)):
-            return f"{value} → (等价'{value}')" if value == 0 else str(value)
-
-        return str(value)
-
-    def _format_structure(data: Any) -> Any:
-        """安全遍历数据结构并格式化"""
-        if not isinstance(data, (dict, list, str, int, float, bool)):
-            return str(data)  # 处理不可序列化对象
-        if isinstance(data, dict):
-            return {k: _format_structure(v) for k, v in data.items()}
-        elif isinstance(data, list):
-            return [_format_structure(e) for e in data]
-        else:
-            # 仅叶子节点被格式化
-            return _format_value(data)
+def _is_same_type(origin_val: Any, current_val: Any, type_groups: _TypeGroups) -> bool:
+    """仅处理类型组配置"""
+    origin_type = type(origin_val)
+    current_type = type(current_val)
+    if not type_groups.has_groups:
+        return origin_type is current_type
+    return origin_type is current_type or type_groups.in_same_group(origin_type, current_type)
 
-    def _truncate(s: str, max_len: int = 50) -> str:
-        """字符串截断"""
-        return s[:max_len] + "..." if len(s) > max_len else s
 
-    # 主函数逻辑开始
-    differences = []
-    exclude_fields = exclude_fields or {"go_article_service"}
-    deep_diff_contrast_config = deep_diff_contrast_config or {
-        # 忽略对比列表顺序
-        "ignore_order": True,
-        # 忽略类型不一致
-        # 'ignore_type_in_groups': [(int, str, float, bool)],
-    }
+def _type_detail(obj: Any) -> str:
+    """增强类型描述（JSON 常见类型按具体类型查表，其余类型逐级判断）"""
+    handler = _TYPE_DETAIL_HANDLERS.get(type(obj))
+    if handler is not None:
+        return handler(obj)
+    if obj is None:
+        return "null"
+    if isinstance(obj, bool):
+        return "bool"
+    if isinstance(obj, (int, float)):
+        return f"{type(obj).__name__}({obj})"
+    if isinstance(obj, str):
+        return f"str('{_truncate(obj)}')" if obj else "str(空)"
+    if isinstance(obj, list):
+        return f"list[{len(obj)}]"
+    if isinstance(obj, dict):
+        return f"dict[{len(obj)}]"
+    return type(obj).__name__
 
-    # 处理null值特殊情况（必须在类型检查之前）
-    if origin_data is None and current_data is None:
-        return differences
-    if origin_data is None:
-        if check_missing:
-            differences.append(f"[字段缺失] {path} (Origin类型: null)")
-        return differences
-    if current_data is None:
-        if check_redundant:
-            differences.append(f"[冗余字段] {path} (Current类型: null)")
-        return differences
 
-    origin_data = deepcopy(origin_data)
-    current_data = deepcopy(current_data)
+def _format_value(value: Any) -> str:
+    """仅格式化单个值，不修改容器结构"""
+    handler = _FORMAT_VALUE_HANDLERS.get(type(value))
+    if handler is not None:
+        return handler(value)
 
-    # 判断是否是第一次进入函数
-    if not path:
-        # 检查origin_data和current_data是否为字典和列表类型
-        if not isinstance(origin_data, (dict, list)) or not isinstance(
-            current_data, (dict, list)
-        ):
-            raise ValueError("Origin和Current数据必须是字典或列表类型")
+    if isinstance(value, str):
+        return _format_str_value(value)
 
-    # 主对比逻辑
-    if isinstance(origin_data, dict) and isinstance(current_data, dict):
-        return _compare_dicts(
-            origin_data,
-            current_data,
-            path,
-            check_value,
-            check_missing,
-            check_redundant,
-            check_type,
-            exclude_fields,
-            deep_diff_contrast_config,
-            differences,
-            open_log,
-            check_top_level_list_length,
-        )
-    elif isinstance(origin_data, list) and isinstance(current_data, list):
-        return _compare_lists(
-            origin_data,
-            current_data,
-            path,
-            check_value,
-            check_missing,
-            check_redundant,
-            check_type,
-            exclude_fields,
-            deep_diff_contrast_config,
-            differences,
-            open_log,
-            check_top_level_list_length,
-        )
-    else:
-        # origin_data和current_data类型不一致
-        # 注意：只有顶层结构类型（path == ""）才始终检查，不受 check_type 参数影响
-        # 嵌套结构中的类型检查应该受 check_type 控制
-        # 但需要考虑 deep_diff_contrast_config 中的 ignore_type_in_groups 配置
-        is_top_level = (path == "")
-        should_check_structure_type = is_top_level or check_type
-        
-        if should_check_structure_type and not _is_same_type(origin_data, current_data, deep_diff_contrast_config):
-            differences.append(
-                f"[类型冲突] {path} "
-                f"Origin类型: {_type_detail(origin_data)} → "
-                f"Current类型: {_type_detail(current_data)}"
-            )
-    return differences
+    if isinstance(value, bool):
+        return str(value).lower()
+
+    if isinstance(value, (int, float)):
+        return _format_number_value(value)
+
+    return str(value)
+
+
+def _format_str_value(value: str) -> str:
+    if value == "":
+        return "'' → (等价0)"
+    if value.isdigit():
+        return f"'{value}' → ({int(value)})"
+    return f"'{value}'"
+
+
+def _format_number_value(value: Union[int, float]) -> str:
+    return f"{value} → (等价'{value}')" if value == 0 else str(value)
+
+
+def _format_structure(data: Any) -> Any:
+    """安全遍历数据结构并格式化（仅叶子节点被格式化，结果与 _format_value 一致）"""
+    data_type = type(data)
+    if _IS_DICT[data_type]:
+        return {k: _format_structure(v) for k, v in data.items()}
+    if _IS_LIST[data_type]:
+        return [_format_structure(e) for e in data]
+    return _format_value(data)
+
+
+def _truncate(s: str, max_len: int = 50) -> str:
+    """字符串截断"""
+    return s[:max_len] + "..." if len(s) > max_len else s
+
+
+# 按具体类型分派的格式化函数，子类等其他类型回退到 isinstance 判断
+_TYPE_DETAIL_HANDLERS: Dict[type, Callable[[Any], str]] = {
+    type(None): lambda obj: "null",
+    bool: lambda obj: "bool",
+    int: lambda obj: f"int({obj})",
+    float: lambda obj: f"float({obj})",
+    str: lambda obj: f"str('{_truncate(obj)}')" if obj else "str(空)",
+    list: lambda obj: f"list[{len(obj)}]",
+    dict: lambda obj: f"dict[{len(obj)}]",
+}
+
+_FORMAT_VALUE_HANDLERS: Dict[type, Callable[[Any], str]] = {
+    str: _format_str_value,
+    bool: lambda value: "true" if value else "false",
+    int: _format_number_value,
+    float: _format_number_value,
+    type(None): str,
+}
+
+
+def _json_loads(text: Union[str, bytes]) -> Any:
+    """
+    解析 JSON 文本，固定使用标准库 json
+    orjson 会把超出 64 位范围的整数解析为 float，两个不同的大整数可能被判为相等，或与普通整数报出类型冲突，
+    因此解析不使用 orjson，只在输出结果时使用
+    """
+    # 不再额外 sys.intern 字典键：标准库在同一次解析内会复用相同的键，main() 的两侧数据同在一份 JSON 参数里解析。
+    # 实测逐层重建字典做驻留使解析耗时翻倍，对比阶段的字典查找却没有可测的收益
+    return json.loads(text)
+
+
+def _write_json(obj: Any, indent: bool = False) -> None:
+    """
+    将 obj 序列化为 JSON（中文原样输出）写到标准输出并换行，输出格式与 json.dumps 一致
+    缩进输出（可能很大的差异结果）在安装了 orjson 且标准输出本就按 UTF-8 编码、不转换换行符时，
+    由 orjson 直接产出字节写入底层缓冲区，省去解码成 str 再由 stdout 编码回字节的两次整段拷贝
+    """
+    buffer = getattr(sys.stdout, "buffer", None)
+    if indent and orjson is not None and buffer is not None and _stdout_is_utf8():
+        # 先 flush 文本层，保证之前 print 的内容仍排在前面
+        sys.stdout.flush()
+        buffer.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        buffer.write(b"\n")
+        buffer.flush()
+        return
+    # 紧凑输出保持 json.dumps 默认的 ", " / ": " 分隔符，与是否安装 orjson 无关
+    print(json.dumps(obj, ensure_ascii=False, indent=2 if indent else None))
+
+
+def _stdout_is_utf8() -> bool:
+    """标准输出的文本层是否按 UTF-8 编码且不转换换行符，此时直接写入 UTF-8 字节与经文本层写出的结果相同"""
+    encoding = getattr(sys.stdout, "encoding", None)
+    if not encoding or os.linesep != "\n":
+        return False
+    try:
+        return codecs.lookup(encoding).name == "utf-8"
+    except LookupError:
+        return False
 
 
-def main():
+def main() -> None:
     """
     主函数：处理输入参数并执行核心逻辑 并返回结果 结果为json格式 从 Apifox 获取输入参数
     参数：
@@ -865,7 +1602,7 @@ def main():
         # 从命令行参数获取JSON字符串
         if len(sys.argv) > 1:
             input_json = sys.argv[1]
-            params = json.loads(input_json)
+            params = _json_loads(input_json)
         else:
             # 如果没有参数，返回错误信息
             result = {
@@ -873,7 +1610,7 @@ def main():
                 "error": "缺少输入参数，需要传入JSON格式的参数",
                 "differences": []
             }
-            print(json.dumps(result, ensure_ascii=False))
+            _write_json(result)
             return
         
         # 提取必需参数
@@ -886,7 +1623,7 @@ def main():
                 "error": "缺少必需参数：origin_data 和 current_data",
                 "differences": []
             }
-            print(json.dumps(result, ensure_ascii=False))
+            _write_json(result)
             return
         
         # 提取可选参数并设置默认值
@@ -901,13 +1638,11 @@ def main():
         path = params.get("path", "")
         
         # 类型转换：exclude_fields 从列表转换为集合
-        if exclude_fields is not None:
+        if exclude_fields is not None and not isinstance(exclude_fields, (set, frozenset)):
             if isinstance(exclude_fields, list):
-                exclude_fields = set(exclude_fields)
-            elif isinstance(exclude_fields, set):
-                pass  # 已经是集合，无需转换
+                exclude_fields = frozenset(exclude_fields)
             else:
-                exclude_fields = set([exclude_fields])  # 单个字符串转换为集合
+                exclude_fields = frozenset((exclude_fields,))  # 单个字符串转换为集合
         
         # 调用 compare_structures 函数
         differences = compare_structures(
@@ -933,7 +1668,7 @@ def main():
         }
         
         # 输出JSON格式结果（Apifox会读取标准输出）
-        print(json.dumps(result, ensure_ascii=False, indent=2))
+        _write_json(result, indent=True)
         
     except json.JSONDecodeError as e:
         result = {
@@ -941,14 +1676,14 @@ def main():
             "error": f"JSON解析错误: {str(e)}",
             "differences": []
         }
-        print(json.dumps(result, ensure_ascii=False))
+        _write_json(result)
     except Exception as e:
         result = {
             "success": False,
             "error": f"执行错误: {str(e)}",
             "differences": []
         }
-        print(json.dumps(result, ensure_ascii=False))
+        _write_json(result)
 
 
 if __name__ == "__main__":
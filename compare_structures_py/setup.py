@@ -3,16 +3,53 @@ setup.py - compare_structures Python 包安装配置
 """
 
 from setuptools import setup, find_packages
+from setuptools.command.build_py import build_py
 import os
+import shutil
+
+# setup.py 所在目录即包 compare_structures_py 的源目录
+HERE = os.path.dirname(os.path.abspath(__file__))
+# 包目录中不属于包内容的脚本：安装配置与场景测试，打包时排除
+NON_PACKAGE_MODULES = {"setup", "test_compare_structures_scenarios"}
 
 # 读取 README 文件（如果存在）
 def read_readme():
-    readme_path = os.path.join(os.path.dirname(__file__), "..", "README.md")
+    readme_path = os.path.join(HERE, "..", "README.md")
     if os.path.exists(readme_path):
         with open(readme_path, "r", encoding="utf-8") as f:
             return f.read()
     return ""
 
+# 可选编译：设置环境变量 COMPARE_STRUCTURES_USE_MYPYC=1 时用 mypyc 把对比模块编译为 C 扩展
+# 需要先安装 mypy，并以 --no-build-isolation 安装，否则隔离的构建环境中没有 mypyc
+# 未设置时按纯 Python 安装，两种方式对外接口一致
+def build_ext_modules():
+    if os.environ.get("COMPARE_STRUCTURES_USE_MYPYC") != "1":
+        return []
+    try:
+        from mypyc.build import mypycify
+    except ImportError:
+        raise RuntimeError(
+            "COMPARE_STRUCTURES_USE_MYPYC=1 需要 mypyc：请先 pip install mypy，再使用 pip install --no-build-isolation ."
+        )
+    # mypyc 按源文件所在目录名推导模块名，而检出目录或 sdist 解包的临时目录名并不固定，
+    # 先把包源文件复制到 build/mypyc_src/compare_structures_py 再编译，模块名始终是 compare_structures_py.compare_structures
+    # --no-namespace-packages 使模块名推导止于 mypyc_src（不含 __init__.py），不会继续向上并入检出目录名
+    staging = os.path.join(HERE, "build", "mypyc_src", "compare_structures_py")
+    os.makedirs(staging, exist_ok=True)
+    for name in ("__init__.py", "compare_structures.py"):
+        shutil.copyfile(os.path.join(HERE, name), os.path.join(staging, name))
+    return mypycify(
+        ["--ignore-missing-imports", "--no-namespace-packages", os.path.join(staging, "compare_structures.py")]
+    )
+
+class BuildPy(build_py):
+    """包目录即当前目录，收集包内模块时排除 setup.py 与场景测试脚本"""
+
+    def find_package_modules(self, package, package_dir):
+        modules = super().find_package_modules(package, package_dir)
+        return [module for module in modules if module[1] not in NON_PACKAGE_MODULES]
+
 setup(
     name="compare-structures",
     version="1.0.0",
@@ -23,6 +60,10 @@ setup(
     long_description_content_type="text/markdown",
     url="https://github.com/cuihaohao1220/compare_structures",
     packages=["compare_structures_py"],
+    # setup.py 位于包目录内部，包 compare_structures_py 即当前目录
+    package_dir={"compare_structures_py": "."},
+    ext_modules=build_ext_modules(),
+    cmdclass={"build_py": BuildPy},
     classifiers=[
         "Development Status :: 4 - Beta",
         "Intended Audience :: Developers",
@@ -36,9 +77,11 @@ setup(
         "License :: OSI Approved :: MIT License",
     ],
     python_requires=">=3.7",
-    install_requires=[
-        "logzero>=1.7.0",
-    ],
+    install_requires=[],
+    extras_require={
+        # 可选加速：命令行入口使用 orjson 输出 JSON
+        "speed": ["orjson>=3.0"],
+    },
     keywords="compare, diff, structure, dictionary, list, comparison",
     project_urls={
         "Bug Reports": "https://github.com/cuihaohao1220/compare_structures/issues",
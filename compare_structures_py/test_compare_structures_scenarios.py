@@ -8,7 +8,8 @@ compare_structures 函数功能验证测试脚本
 import sys
 import json
 import os
-from compare_structures import compare_structures
+import subprocess
+from compare_structures import compare_structures, iter_differences
 
 
 def test_scenario(name: str, origin_data, current_data, **kwargs):
@@ -474,6 +475,282 @@ def main():
         print(f"❌ 测试失败: {e}")
         all_passed = False
 
+    # ========== 场景 22: 限制差异条数 ==========
+    try:
+        origin = {"a": 1, "b": 2, "c": 3, "d": 4}
+        current = {"a": 10, "b": 20, "c": 30, "d": 40}
+        diffs = test_scenario("场景22: 限制差异条数", origin, current, max_diffs=2)
+        # 只返回前两条差异，顺序与不限制时一致
+        if diffs != compare_structures(origin, current)[:2]:
+            print(f"⚠️  max_diffs=2 应该只返回前两条差异")
+            all_passed = False
+
+        # 达到条数后同一个字典中剩余的字段不再对比
+        class CountingDict(dict):
+            def items(self):
+                self.visited = 0
+                for item in dict.items(self):
+                    self.visited += 1
+                    yield item
+
+        origin = CountingDict((f"k{i}", i) for i in range(1000))
+        current = {f"k{i}": i + 1 for i in range(1000)}
+        compare_structures(origin, current, max_diffs=2)
+        print(f"达到 max_diffs 时已遍历字段数: {origin.visited}")
+        if origin.visited != 2:
+            print(f"⚠️  达到 max_diffs 后应该立即停止对比，实际遍历了 {origin.visited} 个字段")
+            all_passed = False
+    except Exception as e:
+        print(f"❌ 测试失败: {e}")
+        all_passed = False
+
+    # ========== 场景 23: 生成器逐条获取差异 ==========
+    try:
+        print(f"\n{'='*60}")
+        print("测试场景: 场景23: 生成器逐条获取差异")
+        print(f"{'='*60}")
+        origin = {"user": {"name": "张三", "age": 25}, "tags": ["a", "b"]}
+        current = {"user": {"name": "李四", "age": 26}, "tags": ["a", "c"]}
+        first_diff = next(iter_differences(origin, current), None)
+        print(f"第一处差异: {first_diff}")
+        # 生成器产出的差异与 compare_structures 的结果一致
+        if list(iter_differences(origin, current)) != compare_structures(origin, current):
+            print(f"⚠️  iter_differences 的结果应该与 compare_structures 一致")
+            all_passed = False
+        if first_diff != "[值变化] user.name Origin值: '张三' → Current值: '李四'":
+            print(f"⚠️  第一处差异应该是 user.name 的值变化")
+            all_passed = False
+    except Exception as e:
+        print(f"❌ 测试失败: {e}")
+        all_passed = False
+
+    # ========== 场景 24: 并行对比长列表 ==========
+    try:
+        # 列表长度达到并行阈值（64）才会启用线程池
+        origin = {"rows": [{"id": i, "tags": [i, 0]} for i in range(64)]}
+        current = {"rows": [{"id": i, "tags": [i, 0]} for i in range(64)]}
+        current["rows"][10]["id"] = -1
+        current["rows"][50]["tags"] = [50]
+        config = {"ignore_order": False}
+        diffs = test_scenario(
+            "场景24: 并行对比长列表", origin, current, deep_diff_contrast_config=config, enable_parallel=True
+        )
+        # 并行对比的差异及顺序与串行一致
+        if diffs != compare_structures(origin, current, deep_diff_contrast_config=config):
+            print(f"⚠️  enable_parallel=True 的结果应该与串行对比一致")
+            all_passed = False
+    except Exception as e:
+        print(f"❌ 测试失败: {e}")
+        all_passed = False
+
+    # ========== 场景 25: 超出 64 位范围的整数 ==========
+    try:
+        # 通过命令行入口对比，参数解析时大整数必须保持为 int，不能被转为 float
+        print("\n场景25: 超出 64 位范围的整数（命令行入口）")
+        params = (
+            '{"origin_data": {"id": 123456789012345678901234567890, "uid": 18446744073709551616},'
+            ' "current_data": {"id": 123456789012345678901234567891, "uid": 1}}'
+        )
+        script_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "compare_structures.py")
+        # 子进程的标准输出固定为 UTF-8，不受本机控制台编码影响
+        output = subprocess.run(
+            [sys.executable, script_path, params],
+            stdout=subprocess.PIPE,
+            env=dict(os.environ, PYTHONIOENCODING="utf-8"),
+            check=True,
+        ).stdout.decode("utf-8")
+        diffs = json.loads(output)["differences"]
+        for diff in diffs:
+            print(f"  {diff}")
+        expected = [
+            "[值变化] id Origin值: 123456789012345678901234567890 → Current值: 123456789012345678901234567891",
+            "[值变化] uid Origin值: 18446744073709551616 → Current值: 1",
+        ]
+        if diffs != expected:
+            print(f"⚠️  大整数应该按 int 报告值变化，而不是被判为相等或类型冲突")
+            all_passed = False
+    except Exception as e:
+        print(f"❌ 测试失败: {e}")
+        all_passed = False
+
+    # ========== 场景 26: 超过递归深度限制的嵌套（不检查类型） ==========
+    try:
+        origin = {"a": 1}
+        current = {"a": 1}
+        for _ in range(3000):
+            origin = {"a": origin}
+            current = {"a": current}
+        print("\n场景26: 超过递归深度限制的嵌套（不检查类型）")
+        # 深层嵌套的对比不能触发 RecursionError，check_type=False 时也一样
+        diffs = compare_structures(origin, current, check_type=False)
+        if diffs:
+            print(f"⚠️  完全相同的深层嵌套不应该产生差异: {diffs[:3]}")
+            all_passed = False
+        else:
+            print("✅ 结果: 无差异")
+    except Exception as e:
+        print(f"❌ 测试失败: {type(e).__name__}: {e}")
+        all_passed = False
+
+    # ========== 场景 27: 忽略顺序的列表中包含超过递归深度限制的元素 ==========
+    try:
+        def deep_item(leaf):
+            item = {"a": leaf}
+            for _ in range(3000):
+                item = {"a": item}
+            return item
+
+        origin = [deep_item(1), deep_item(2)]
+        current = [deep_item(2), deep_item(3)]
+        print("\n场景27: 忽略顺序的列表中包含超过递归深度限制的元素")
+        # 匹配键与逐对匹配都不能触发 RecursionError，配置类型组时走逐对匹配
+        expected = ["[列表差异] [0] (iterable_item_removed)", "[列表差异] [1] (iterable_item_added)"]
+        diffs = compare_structures(origin, current)
+        grouped_diffs = compare_structures(
+            origin,
+            [deep_item("2"), deep_item(3)],
+            deep_diff_contrast_config={"ignore_order": True, "ignore_type_in_groups": [(int, str)]},
+        )
+        for diff in diffs:
+            print(f"  {diff}")
+        if diffs != expected or grouped_diffs != expected:
+            print(f"⚠️  深层元素应该与顺序无关地配对: {diffs} / {grouped_diffs}")
+            all_passed = False
+    except Exception as e:
+        print(f"❌ 测试失败: {type(e).__name__}: {e}")
+        all_passed = False
+
+    # ========== 场景 28: 忽略顺序时并行对比长列表 ==========
+    try:
+        # 配置类型组时逐对匹配，匹配上的元素子树提交给线程池；current 顺序打乱，部分 id 改为字符串
+        origin = {"rows": [{"id": i, "tags": [i, "x"]} for i in range(80)]}
+        current = {"rows": [{"id": str(i) if i % 3 else i, "tags": [i, "x"]} for i in reversed(range(80))]}
+        current["rows"][5]["tags"] = [74, "y"]
+        current["rows"][40]["id"] = 1000
+        config = {"ignore_order": True, "ignore_type_in_groups": [(int, str)]}
+        diffs = test_scenario(
+            "场景28: 忽略顺序时并行对比长列表", origin, current, deep_diff_contrast_config=config, enable_parallel=True
+        )
+        # 并行对比的差异及顺序与串行一致
+        if diffs != compare_structures(origin, current, deep_diff_contrast_config=config) or len(diffs) != 4:
+            print(f"⚠️  enable_parallel=True 的结果应该与串行对比一致")
+            all_passed = False
+    except Exception as e:
+        print(f"❌ 测试失败: {e}")
+        all_passed = False
+
+    # ========== 场景 29: 按顺序对比同构记录列表 ==========
+    try:
+        # 不少于 16 条字段相同的扁平记录时先整体筛出变化的记录，结果必须与逐条对比一致
+        origin = [{"id": i, "name": f"u{i}", "score": 1.5, "ok": True} for i in range(20)]
+        current = [{"id": i, "name": f"u{i}", "score": 1.5, "ok": True} for i in range(20)]
+        # NaN 与自身不等
+        origin[2]["score"] = float("nan")
+        current[2]["score"] = float("nan")
+        # 1、True、1.0 值相等但类型不同
+        origin[4]["ok"] = 1
+        current[5]["ok"] = 1
+        current[6]["score"] = 1
+        origin[7]["score"] = 1
+        current[7]["score"] = True
+        current[9]["name"] = "changed"
+        del current[11]["ok"]
+        current[13]["id"] = "13"
+        config = {"ignore_order": False}
+        diffs = test_scenario("场景29: 按顺序对比同构记录列表", origin, current, deep_diff_contrast_config=config)
+        expected = [
+            "[值变化] [2].score Origin值: nan → Current值: nan",
+            "[类型冲突] [4].ok Origin类型: int(1) → Current类型: bool",
+            "[类型冲突] [5].ok Origin类型: bool → Current类型: int(1)",
+            "[类型冲突] [6].score Origin类型: float(1.5) → Current类型: int(1)",
+            "[类型冲突] [7].score Origin类型: int(1) → Current类型: bool",
+            "[值变化] [9].name Origin值: 'u9' → Current值: 'changed'",
+            "[字段缺失] [11].ok (Origin类型: bool)",
+            "[类型冲突] [13].id Origin类型: int(13) → Current类型: str('13')",
+        ]
+        if diffs != expected:
+            print(f"⚠️  同构记录列表的差异应该与逐条对比一致")
+            all_passed = False
+        # 不检查类型时 1 与 True 相等，1.5 与 1 按值变化报告
+        expected = [
+            "[值变化] [2].score Origin值: nan → Current值: nan",
+            "[值变化] [6].score Origin值: 1.5 → Current值: 1",
+            "[值变化] [9].name Origin值: 'u9' → Current值: 'changed'",
+            "[字段缺失] [11].ok (Origin类型: bool)",
+            "[值变化] [13].id Origin值: 13 → Current值: '13' → (13)",
+        ]
+        if compare_structures(origin, current, check_type=False, deep_diff_contrast_config=config) != expected:
+            print(f"⚠️  check_type=False 时同构记录列表的差异应该与逐条对比一致")
+            all_passed = False
+    except Exception as e:
+        print(f"❌ 测试失败: {e}")
+        all_passed = False
+
+    # ========== 场景 30: 按顺序对比基础类型长列表 ==========
+    try:
+        # 不少于 16 个基础类型元素时先整体筛出变化的下标，结果必须与逐个对比一致
+        # 包含相等与不等的值、值相等但类型不同的 bool/int/float，以及与自身不等的 NaN
+        origin = {"values": [0, 1, 2, True, 1, 1.0, float("nan"), "a", None, 5, 6, 7, 8, 9, 10, 11, 0.5, False, 12]}
+        current = {"values": [0, 1, 3, 1, True, 1, float("nan"), "b", None, 5, 6, 7, "8", 9, 10, 11, 0.5, 0, 12, 13]}
+        config = {"ignore_order": False}
+        diffs = test_scenario("场景30: 按顺序对比基础类型长列表", origin, current, deep_diff_contrast_config=config)
+        expected = [
+            "[值变化] values[2] Origin值: 2 → Current值: 3",
+            "[类型冲突] values[3] Origin类型：bool → Current类型：int(1)",
+            "[类型冲突] values[4] Origin类型：int(1) → Current类型：bool",
+            "[类型冲突] values[5] Origin类型：float(1.0) → Current类型：int(1)",
+            "[值变化] values[6] Origin值: nan → Current值: nan",
+            "[值变化] values[7] Origin值: 'a' → Current值: 'b'",
+            "[类型冲突] values[12] Origin类型：int(8) → Current类型：str('8')",
+            "[类型冲突] values[17] Origin类型：bool → Current类型：int(0)",
+            "[列表差异] values[19] (iterable_item_added)",
+        ]
+        if diffs != expected:
+            print(f"⚠️  基础类型长列表的差异应该与逐个对比一致")
+            all_passed = False
+        # 不检查类型时 1、True、1.0 互相相等
+        expected = [
+            "[值变化] values[2] Origin值: 2 → Current值: 3",
+            "[值变化] values[6] Origin值: nan → Current值: nan",
+            "[值变化] values[7] Origin值: 'a' → Current值: 'b'",
+            "[值变化] values[12] Origin值: 8 → Current值: '8' → (8)",
+            "[列表差异] values[19] (iterable_item_added)",
+        ]
+        if compare_structures(origin, current, check_type=False, deep_diff_contrast_config=config) != expected:
+            print(f"⚠️  check_type=False 时基础类型长列表的差异应该与逐个对比一致")
+            all_passed = False
+    except Exception as e:
+        print(f"❌ 测试失败: {e}")
+        all_passed = False
+
+    # ========== 场景 31: 配置类型组时忽略顺序匹配重复元素 ==========
+    try:
+        # 配置类型组时逐对匹配，每个 current 元素只能被匹配一次，重复元素按出现顺序依次配对
+        origin = {"items": [1, 1, 1, {"a": 1}, {"a": 1}, "2", [1, "x"], 3]}
+        current = {"items": ["1", {"a": "1"}, 2, 1, [1, "x"], 4, {"a": 1}, 1]}
+        config = {"ignore_order": True, "ignore_type_in_groups": [(int, str)]}
+        diffs = test_scenario("场景31: 配置类型组时忽略顺序匹配重复元素", origin, current, deep_diff_contrast_config=config)
+        expected = [
+            "[列表差异] items[7] (iterable_item_removed)",
+            "[列表差异] items[5] (iterable_item_added)",
+        ]
+        if diffs != expected:
+            print(f"⚠️  重复元素应该一一配对，只有 3 与 4 未匹配")
+            all_passed = False
+        # current 少一个 1 时，origin 中第三个 1 没有可配对的元素
+        current["items"].pop()
+        expected = [
+            "[列表差异] items[2] (iterable_item_removed)",
+            "[列表差异] items[7] (iterable_item_removed)",
+            "[列表差异] items[5] (iterable_item_added)",
+        ]
+        if compare_structures(origin, current, deep_diff_contrast_config=config) != expected:
+            print(f"⚠️  已匹配的 current 元素不能被重复配对")
+            all_passed = False
+    except Exception as e:
+        print(f"❌ 测试失败: {e}")
+        all_passed = False
+
     # ========== 总结 ==========
     print("\n" + "=" * 60)
     if all_passed: